@@ -2,8 +2,9 @@ import os
 import time
 import json
 import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from flask import Flask, render_template, request, session, redirect, url_for, jsonify
 from dotenv import load_dotenv
 from services import (
@@ -13,7 +14,8 @@ from services import (
     setup_repository_for_stage, log_route_visit, should_log_route, mark_route_as_logged,
     mark_stage_transition, load_tutorials, get_tutorial_by_condition,
     save_vscode_workspace_storage, start_session_recording, stop_session_recording, is_recording_active,
-    upload_session_recording_to_azure,
+    upload_session_recording_to_azure, upload_session_recording_to_azure_async, wait_for_recording_uploads,
+    wait_for_log_commits,
     setup_tutorial_repository, open_vscode_with_tutorial, commit_tutorial_completion,
     get_session_log_history, determine_correct_route
 )
@@ -24,9 +26,18 @@ load_dotenv()
 app = Flask(__name__)
 app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
 
+# Background listener that performs the actual log I/O
+_log_listener = None
+
 # Configure logging
 def setup_logging(development_mode=False):
-    """Set up logging configuration with file output."""
+    """
+    Set up logging configuration with file output.
+    Records are handed to a queue and written by a background listener thread,
+    so tracking threads and request handlers never block on log file I/O.
+    """
+    global _log_listener
+    
     # Create logs directory if it doesn't exist
     logs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
     os.makedirs(logs_dir, exist_ok=True)
@@ -51,6 +62,9 @@ def setup_logging(development_mode=False):
     # Remove existing handlers to avoid duplication
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    if _log_listener is not None:
+        atexit.unregister(_log_listener.stop)
+        _log_listener.stop()
     
     # File handler with rotation
     file_handler = RotatingFileHandler(
@@ -60,14 +74,21 @@ def setup_logging(development_mode=False):
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # Console handler for development mode
     if development_mode:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Only the queue handler is attached to the root logger; the listener owns the real handlers
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
     
     return log_filepath
 
@@ -432,13 +453,10 @@ def goodbye():
             if recording_stopped:
                 logger.info(f"Screen recording stopped - participant {participant_id} reached goodbye page")
                 
-                # Upload recording to Azure Blob Storage
+                # Upload recording to Azure Blob Storage in the background so the page renders immediately;
+                # the upload logs its own result
                 logger.info(f"Uploading recording to Azure for participant {participant_id}, stage {study_stage}")
-                upload_success = upload_session_recording_to_azure(participant_id, study_stage)
-                if upload_success:
-                    logger.info(f"Recording uploaded to Azure for participant {participant_id}, stage {study_stage}")
-                else:
-                    logger.error(f"Failed to upload recording to Azure for participant {participant_id}, stage {study_stage}")
+                upload_session_recording_to_azure_async(participant_id, study_stage)
             else:
                 logger.error(f"Failed to stop screen recording for participant {participant_id} at goodbye page")
         else:
@@ -906,7 +924,8 @@ if __name__ == '__main__':
     
     # Set up graceful shutdown for screen recording
     def cleanup_on_exit():
-        # Stop any active screen recording
+        # Stop any active screen recording (and the focus and clipboard trackers) first,
+        # so their final events are written before the logs are committed
         if is_recording_active():
             logger.info("Stopping active screen recording on app shutdown...")
             recording_stopped = stop_session_recording()
@@ -922,6 +941,11 @@ if __name__ == '__main__':
                         logger.error("Failed to upload recording to Azure before shutdown")
                 except Exception as e:
                     logger.error(f"Error uploading recording to Azure on shutdown: {e}")
+        
+        # Let uploads started from the goodbye page finish before exiting
+        wait_for_recording_uploads()
+        # Commit and push route visits still queued for the logs repository, plus the final tracker events
+        wait_for_log_commits()
     
     atexit.register(cleanup_on_exit)
     logger.info("Screen recording shutdown handler registered")
@@ -1,21 +1,280 @@
 import os
+import re
+import atexit
+import errno
 import json
+import hashlib
+import functools
+import signal
 import subprocess
 import platform
 import shutil
 import time
 import logging
-import pyperclip
-import time
 import threading
-import logging
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from typing import Dict, List, Any, Callable, Iterator, NamedTuple, Optional, Tuple
+
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import obsws_python as obsws
+except ImportError:
+    obsws = None
+
+# Platform-specific modules are imported once here; each backend checks its flag
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import win32gui
+    import win32process
+    import win32clipboard
+    import win32con
+    import pywintypes
+    _HAVE_WIN32 = True
+except ImportError:
+    _HAVE_WIN32 = False
+
+try:
+    from AppKit import NSWorkspace, NSPasteboard, NSPasteboardTypeString
+    from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+    _HAVE_PYOBJC = True
+except ImportError:
+    _HAVE_PYOBJC = False
+
+try:
+    from Xlib import X
+    from Xlib import display as xdisplay
+    _HAVE_XLIB = True
+except ImportError:
+    _HAVE_XLIB = False
 
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Host platform, resolved once (platform.system() calls uname() on every use)
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+
+# Default OBS recording directories per platform, resolved once at import
+_HOME_DIR = os.path.expanduser("~")
+_OBS_DEFAULT_RECORDING_PATHS = {
+    "Windows": (
+        os.path.join(_HOME_DIR, "Videos"),
+        os.path.join(_HOME_DIR, "Documents"),
+        os.path.join(_HOME_DIR, "Desktop"),
+    ),
+    "Darwin": (
+        os.path.join(_HOME_DIR, "Movies"),
+        os.path.join(_HOME_DIR, "Desktop"),
+        os.path.join(_HOME_DIR, "Documents"),
+    ),
+    "Linux": (
+        os.path.join(_HOME_DIR, "Videos"),
+        os.path.join(_HOME_DIR, "Desktop"),
+        os.path.join(_HOME_DIR, "Documents"),
+    ),
+}
+
+_OBS_RECORDING_DIRS = _OBS_DEFAULT_RECORDING_PATHS.get(_SYSTEM, _OBS_DEFAULT_RECORDING_PATHS["Linux"])
+
+# OBS executable inside the macOS app bundle (also used to match its process)
+_MACOS_OBS_EXECUTABLE = "/Applications/OBS.app/Contents/MacOS/OBS"
+
+# Default address of the OBS WebSocket server (built into OBS 28+)
+_OBS_WEBSOCKET_HOST = "localhost"
+_OBS_WEBSOCKET_PORT = 4455
+# Seconds before retrying a failed OBS WebSocket connection, so status polls don't block on connect timeouts
+_OBS_WEBSOCKET_RETRY_INTERVAL = 10.0
+
+# How long start_recording() waits for OBS to come up, and how often it checks
+_OBS_STARTUP_TIMEOUT = 7.0
+_OBS_STARTUP_POLL_INTERVAL = 0.1
+
+# Minimal OBS command line arguments per platform (OBS uses its default configuration)
+_OBS_START_ARGS = ("--startrecording", "--minimize") if _IS_DARWIN else ("--startrecording", "--minimize-to-tray")
+
+# Base subprocess options for recording-related processes (OBS, azcopy)
+_RECORDING_SUBPROCESS_KWARGS = {
+    'stdout': subprocess.PIPE,
+    'stderr': subprocess.PIPE,
+    **({'creationflags': subprocess.CREATE_NO_WINDOW} if _IS_WINDOWS else {'start_new_session': True}),
+}
+
+# Options for process-control commands whose output is unused (only return codes are checked)
+_PROCESS_CONTROL_KWARGS = {
+    'stdout': subprocess.DEVNULL,
+    'stderr': subprocess.DEVNULL,
+    **({'creationflags': subprocess.CREATE_NO_WINDOW} if _IS_WINDOWS else {}),
+}
+
+# Recording file names created by start_recording: screen_recording_PARTICIPANT_stageN_YYYYmmdd_HHMMSS.mp4
+_RECORDING_FILENAME_RE = re.compile(r'^screen_recording_(?P<participant_id>.+)_stage(?P<stage>\d+)_\d{8}_\d{6}\.mp4$')
+
+# Common video file extensions used by OBS
+_VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.flv', '.mov', '.avi')
+
+# Size at which tracker JSONL logs are rotated into a new part
+DEFAULT_MAX_LOG_BYTES = 16 * 1024 * 1024
+
+# Flags for the raw append-only descriptor used by JsonlLogWriter (O_BINARY avoids
+# newline translation on Windows)
+_LOG_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+# Maximum number of pid -> process name entries kept by FocusTracker
+_PID_NAME_CACHE_SIZE = 256
+
+# Attempts and delay for opening the Windows clipboard while another app holds it open
+_CLIPBOARD_OPEN_ATTEMPTS = 10
+_CLIPBOARD_OPEN_RETRY_DELAY = 0.01
+
+# AppleScript returning the frontmost app name and its front window title (may require
+# accessibility permissions), separated by a newline
+_MACOS_FOCUS_SCRIPT = (
+    'tell application "System Events"\n'
+    'set frontProc to first application process whose frontmost is true\n'
+    'set appName to name of frontProc\n'
+    'try\n'
+    'set windowName to name of front window of frontProc\n'
+    'on error\n'
+    'set windowName to ""\n'
+    'end try\n'
+    'end tell\n'
+    'return appName & linefeed & windowName'
+)
+
+# Shared compact encoder for the stdlib fallback path (avoids per-call encoder setup)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_jsonl_line(event: Dict[str, Any]) -> bytes:
+    """Serialize an event as one compact UTF-8 encoded JSONL line, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            # orjson rejects e.g. lone surrogates from clipboard text; use the stdlib encoder
+            pass
+    return (_JSON_ENCODER.encode(event) + "\n").encode("utf-8", "replace")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with microseconds and a "Z" suffix."""
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanoseconds // 1000:06d}Z"
+
+
+def iter_jsonl_events(log_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the events stored in a JSONL tracker log.
+    
+    Args:
+        log_path: Path to a focus or clipboard JSONL log
+        
+    Yields:
+        One event dictionary per non-empty line
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_obs_executable_path() -> str:
+    """
+    Probe the platform-specific OBS Studio installation paths (once per process).
+    
+    Returns:
+        Path to OBS Studio executable
+    """
+    if _IS_WINDOWS:
+        # OBS on PATH (single lookup), otherwise the common installation paths
+        obs_on_path = shutil.which("obs64")
+        if obs_on_path:
+            return obs_on_path
+        paths = [
+            r"C:\Program Files\obs-studio\bin\64bit\obs64.exe",
+            r"C:\Program Files (x86)\obs-studio\bin\32bit\obs32.exe",
+            r"C:\Program Files (x86)\obs-studio\bin\64bit\obs64.exe"
+        ]
+        for path in paths:
+            if os.path.exists(path):
+                return path
+        # Not found anywhere; launching the bare name reports a clear error
+        return "obs64.exe"
+    
+    elif _IS_DARWIN:  # macOS
+        # OBS Studio app bundle path on macOS
+        if os.path.exists(_MACOS_OBS_EXECUTABLE):
+            return _MACOS_OBS_EXECUTABLE
+        # Try to find OBS in PATH
+        return shutil.which("obs") or "obs"
+    
+    else:  # Linux
+        # OBS executable on Linux
+        return shutil.which("obs") or "obs"
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_obs_working_dir() -> Optional[str]:
+    """
+    Get the OBS installation directory used as working directory (once per process).
+    
+    Returns:
+        Directory containing the OBS executable, or None if it does not exist
+    """
+    obs_dir = os.path.dirname(_resolve_obs_executable_path())
+    return obs_dir if obs_dir and os.path.exists(obs_dir) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_obs_command() -> Tuple[str, ...]:
+    """
+    Build the OBS command line for screen recording using default configuration (once per process).
+    
+    Returns:
+        OBS argv as a tuple
+    """
+    return (_resolve_obs_executable_path(), *_OBS_START_ARGS)
+
+
+def _move_file(source: str, destination: str) -> None:
+    """
+    Move a file with a single rename when source and destination share a filesystem,
+    falling back to copy + delete across devices.
+    
+    Args:
+        source: Path of the file to move
+        destination: Target file path
+    """
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Different filesystem: copyfile uses the kernel's fast copy path where available
+        shutil.copyfile(source, destination)
+        os.remove(source)
+
+
 class ScreenRecorder:
     """
     Handles screen recording using OBS Studio.
@@ -26,6 +285,19 @@ class ScreenRecorder:
         self.recording_process = None
         self.recording_file_path = None
         self.recording_start_time = None
+        # Set by stop_recording() to interrupt the startup wait in start_recording()
+        self._stop_requested = threading.Event()
+        # OBS WebSocket client, connected on demand while OBS is running
+        self._obs_ws = None
+        # Monotonic time before which a failed WebSocket connection isn't retried
+        self._obs_ws_retry_at = 0.0
+        # (recording_start_time, path) of the last recording file found in the OBS default locations
+        self._found_recording_file = None
+        # Uploads run here so request handlers don't block on azcopy
+        self._post_stop_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="recording-upload")
+        self._pending_uploads: List[Future] = []
+        self._pending_uploads_lock = threading.Lock()
+        self._upload_drain_registered = False
     
     def _get_obs_executable_path(self) -> str:
         """
@@ -34,66 +306,114 @@ class ScreenRecorder:
         Returns:
             Path to OBS Studio executable
         """
-        system = platform.system()
-        
-        if system == "Windows":
-            # Common OBS installation paths on Windows
-            paths = [
-                r"C:\Program Files\obs-studio\bin\64bit\obs64.exe",
-                r"C:\Program Files (x86)\obs-studio\bin\32bit\obs32.exe",
-                r"C:\Program Files (x86)\obs-studio\bin\64bit\obs64.exe"
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-            # Try to find OBS in PATH
-            return "obs64.exe"
-        
-        elif system == "Darwin":  # macOS
-            # OBS Studio app bundle path on macOS
-            obs_app_path = "/Applications/OBS.app/Contents/MacOS/OBS"
-            if os.path.exists(obs_app_path):
-                return obs_app_path
-            # Try to find OBS in PATH
-            return "obs"
-        
-        else:  # Linux
-            # OBS executable on Linux
-            return "obs"
-    
-    def _get_obs_default_recording_paths(self) -> List[str]:
+        return _resolve_obs_executable_path()
+    
+    def _get_obs_websocket(self, retry_now: bool = False):
+        """
+        Get a client for the OBS WebSocket API, if obsws-python is installed and
+        OBS is reachable. The password is read from OBS_WEBSOCKET_PASSWORD.
+        After a failed connection, new attempts wait _OBS_WEBSOCKET_RETRY_INTERVAL seconds.
+        
+        Args:
+            retry_now: Try to connect even if a recent attempt failed
+        
+        Returns:
+            Connected obsws_python.ReqClient, or None to fall back to process checks
+        """
+        if obsws is None:
+            return None
+        if self._obs_ws is None:
+            if not retry_now and time.monotonic() < self._obs_ws_retry_at:
+                return None
+            try:
+                self._obs_ws = obsws.ReqClient(
+                    host=os.getenv('OBS_WEBSOCKET_HOST', _OBS_WEBSOCKET_HOST),
+                    port=int(os.getenv('OBS_WEBSOCKET_PORT', _OBS_WEBSOCKET_PORT)),
+                    password=os.getenv('OBS_WEBSOCKET_PASSWORD', ''),
+                    timeout=2
+                )
+            except Exception as e:
+                # OBS not running or WebSocket server disabled
+                logger.debug("OBS WebSocket not available: %s", e)
+                self._obs_ws_retry_at = time.monotonic() + _OBS_WEBSOCKET_RETRY_INTERVAL
+                return None
+        return self._obs_ws
+    
+    def _close_obs_websocket(self):
+        """Disconnect the OBS WebSocket client, if connected."""
+        if self._obs_ws is not None:
+            try:
+                self._obs_ws.disconnect()
+            except Exception:
+                pass
+            self._obs_ws = None
+    
+    def _stop_obs_websocket_recording(self) -> Optional[str]:
+        """
+        Stop the active recording through the OBS WebSocket API.
+        
+        Returns:
+            Path of the finished recording file reported by OBS, or None if the
+            WebSocket API is unavailable or OBS was not recording
+        """
+        # Stopping through OBS finalizes the file cleanly, so it's worth one connection attempt
+        client = self._get_obs_websocket(retry_now=True)
+        if client is None:
+            return None
+        try:
+            if not client.get_record_status().output_active:
+                return None
+            output_path = client.stop_record().output_path
+            logger.info(f"Stopped OBS recording via WebSocket, file: {output_path}")
+            return output_path
+        except Exception as e:
+            logger.info(f"Could not stop OBS recording via WebSocket: {e}")
+            self._close_obs_websocket()
+            return None
+    
+    def _get_obs_default_recording_paths(self) -> Tuple[str, ...]:
         """
         Get the platform-specific default OBS recording directories.
         
         Returns:
-            List of possible default recording paths for OBS
-        """
-        system = platform.system()
-        home_dir = os.path.expanduser("~")
-        
-        if system == "Windows":
-            # Common default recording paths on Windows
-            return [
-                os.path.join(home_dir, "Videos"),
-                os.path.join(home_dir, "Documents"),
-                os.path.join(home_dir, "Desktop")
-            ]
-        
-        elif system == "Darwin":  # macOS
-            # Default recording paths on macOS
-            return [
-                os.path.join(home_dir, "Movies"),
-                os.path.join(home_dir, "Desktop"),
-                os.path.join(home_dir, "Documents")
-            ]
-        
-        else:  # Linux
-            # Default recording paths on Linux
-            return [
-                os.path.join(home_dir, "Videos"),
-                os.path.join(home_dir, "Desktop"),
-                os.path.join(home_dir, "Documents")
-            ]
+            Tuple of possible default recording paths for OBS
+        """
+        return _OBS_RECORDING_DIRS
+    
+    def _scan_latest_recording_file(self, recording_start_time: float) -> Optional[str]:
+        """
+        Scan the OBS default locations for the newest video file modified after a given time.
+        
+        Args:
+            recording_start_time: Unix timestamp when recording started
+            
+        Returns:
+            Path to the latest recording file, or None if not found
+        """
+        default_paths = self._get_obs_default_recording_paths()
+        
+        def _iter_candidates():
+            for directory in default_paths:
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            # Skip directories and non-video files
+                            if not entry.is_file() or not entry.name.lower().endswith(_VIDEO_EXTENSIONS):
+                                continue
+                            try:
+                                file_mtime = entry.stat().st_mtime
+                            except OSError:
+                                # Skip files we can't access
+                                continue
+                            # Only consider files created/modified after recording started
+                            if file_mtime > recording_start_time:
+                                yield file_mtime, entry.path
+                except OSError:
+                    # Skip missing or unreadable directories
+                    continue
+        
+        latest = max(_iter_candidates(), default=None)
+        return latest[1] if latest else None
     
     def _find_latest_recording_file(self, participant_id: str, study_stage: int, recording_start_time: float) -> Optional[str]:
         """
@@ -107,46 +427,19 @@ class ScreenRecorder:
         Returns:
             Path to the latest recording file, or None if not found
         """
+        # Reuse the file found for this recording, if it is still there
+        if self._found_recording_file and self._found_recording_file[0] == recording_start_time:
+            if os.path.exists(self._found_recording_file[1]):
+                return self._found_recording_file[1]
+        
         try:
-            default_paths = self._get_obs_default_recording_paths()
-            latest_file = None
-            latest_time = recording_start_time  # Only consider files created after recording started
-            
-            # Common video file extensions used by OBS
-            video_extensions = ['.mp4', '.mkv', '.flv', '.mov', '.avi']
-            
-            for directory in default_paths:
-                if not os.path.exists(directory):
-                    continue
-                    
-                for filename in os.listdir(directory):
-                    file_path = os.path.join(directory, filename)
-                    
-                    # Skip directories and non-video files
-                    if not os.path.isfile(file_path):
-                        continue
-                    
-                    # Check if it's a video file
-                    if not any(filename.lower().endswith(ext) for ext in video_extensions):
-                        continue
-                    
-                    try:
-                        # Get file modification time
-                        file_mtime = os.path.getmtime(file_path)
-                        
-                        # Only consider files created/modified after recording started
-                        if file_mtime > latest_time:
-                            latest_file = file_path
-                            latest_time = file_mtime
-                            
-                    except (OSError, PermissionError):
-                        # Skip files we can't access
-                        continue
+            latest_file = self._scan_latest_recording_file(recording_start_time)
             
             if latest_file:
+                self._found_recording_file = (recording_start_time, latest_file)
                 logger.info(f"Found latest recording file: {latest_file}")
             else:
-                logger.info(f"No recording file found in default locations created after {datetime.fromtimestamp(recording_start_time)}")
+                logger.info("No recording file found in default locations created after %s", datetime.fromtimestamp(recording_start_time))
             
             return latest_file
             
@@ -154,6 +447,44 @@ class ScreenRecorder:
             logger.info(f"Error finding latest recording file: {e}")
             return None
     
+    def _wait_for_recording_file(self, recording_start_time: float, timeout: float = 10.0,
+                                 interval: float = 0.2) -> Optional[str]:
+        """
+        Wait until OBS has finished writing the recording file, i.e. the file
+        exists and its size is unchanged for two consecutive samples.
+        
+        Args:
+            recording_start_time: Unix timestamp when recording started
+            timeout: Maximum number of seconds to wait
+            interval: Seconds between samples
+            
+        Returns:
+            Path to the recording file, or None if none appeared before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        recording_file = None
+        last_size = None
+        stable_samples = 0
+        while True:
+            try:
+                if recording_file is None:
+                    recording_file = self._scan_latest_recording_file(recording_start_time)
+                if recording_file is not None:
+                    size = os.stat(recording_file).st_size
+                    stable_samples = stable_samples + 1 if size == last_size else 0
+                    last_size = size
+                    if stable_samples >= 2:
+                        self._found_recording_file = (recording_start_time, recording_file)
+                        return recording_file
+            except OSError:
+                # File was renamed or removed (e.g. OBS remuxing); look for it again
+                recording_file = None
+                last_size = None
+                stable_samples = 0
+            if time.monotonic() >= deadline:
+                return recording_file
+            time.sleep(interval)
+    
     def start_recording(self, participant_id: str, study_stage: int, logs_directory: str) -> bool:
         """
         Start screen recording using OBS Studio with default configuration.
@@ -166,20 +497,20 @@ class ScreenRecorder:
         Returns:
             True if recording started successfully, False otherwise
         """
+        self._stop_requested.clear()
+        
         # Check if OBS is already running before attempting to start
         if self.is_recording():
             logger.info("Screen recording is already in progress - OBS is running")
             return True  # Return True since recording is already active
         
         # Also check for any existing OBS processes more thoroughly
-        system = platform.system()
-        if system == "Darwin":  # macOS
+        if _IS_DARWIN:  # macOS
             try:
                 # Kill any existing OBS processes to ensure clean start
-                cleanup_cmd = ['pkill', '-f', '/Applications/OBS.app/Contents/MacOS/OBS']
-                subprocess.run(cleanup_cmd, capture_output=True, text=True)
+                # (waits for them to terminate)
+                self._terminate_obs_processes()
                 logger.info("Cleaned up any existing OBS processes")
-                time.sleep(1)  # Give processes time to terminate
             except Exception as e:
                 logger.info(f"Error during OBS cleanup: {e}")
         
@@ -193,34 +524,9 @@ class ScreenRecorder:
             recording_filename = f"screen_recording_{participant_id}_stage{study_stage}_{timestamp}.mp4"
             self.recording_file_path = os.path.join(recordings_dir, recording_filename)
             
-            # Get OBS executable path
-            obs_executable = self._get_obs_executable_path()
-            logger.info(f"Using OBS executable: {obs_executable}")
-            
-            # OBS command for screen recording using default configuration
-            system = platform.system()
-            
-            if system == "Windows":
-                # Windows: Use OBS with minimal command line arguments
-                obs_cmd = [
-                    obs_executable,
-                    "--startrecording",
-                    "--minimize-to-tray"
-                ]
-            elif system == "Darwin":  # macOS
-                # macOS: Use OBS with minimal command line arguments
-                obs_cmd = [
-                    obs_executable,
-                    "--startrecording",
-                    "--minimize"
-                ]
-            else:  # Linux
-                # Linux: Use OBS with minimal command line arguments
-                obs_cmd = [
-                    obs_executable,
-                    "--startrecording",
-                    "--minimize-to-tray"
-                ]
+            # OBS command for screen recording using default configuration, resolved once per process
+            obs_cmd = _resolve_obs_command()
+            logger.info(f"Using OBS executable: {obs_cmd[0]}")
             
             # Record the start time for file tracking
             self.recording_start_time = time.time()
@@ -232,30 +538,35 @@ class ScreenRecorder:
             recording_kwargs = self._get_recording_subprocess_kwargs()
             
             # Set working directory to OBS installation directory on Windows to fix locale issue
-            if system == "Windows":
-                obs_dir = os.path.dirname(obs_executable)
-                if os.path.exists(obs_dir):
+            if _IS_WINDOWS:
+                obs_dir = _resolve_obs_working_dir()
+                if obs_dir:
                     recording_kwargs['cwd'] = obs_dir
                     logger.info(f"Setting OBS working directory to: {obs_dir}")
             
             self.recording_process = subprocess.Popen(obs_cmd, **recording_kwargs)
             logger.info(f"OBS process started with PID: {self.recording_process.pid}")
             
-            # Give OBS more time to start and stabilize
+            # Poll until OBS is up (or exits) instead of sleeping a fixed time;
+            # the status checks are in-process, so polling often is cheap
             logger.info("Waiting for OBS to start...")
-            time.sleep(3)
-            
-            # Check if OBS is now running with multiple attempts
             recording_active = False
-            max_attempts = 3
-            for attempt in range(max_attempts):
+            startup_interrupted = False
+            deadline = time.monotonic() + _OBS_STARTUP_TIMEOUT
+            while True:
                 recording_active = self.is_recording()
-                logger.info(f"OBS recording status check (attempt {attempt + 1}): {recording_active}")
-                if recording_active:
+                if recording_active or self.recording_process.poll() is not None:
                     break
-                if attempt < max_attempts - 1:
-                    logger.info(f"OBS not detected yet, waiting 2 more seconds...")
-                    time.sleep(2)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                startup_interrupted = self._stop_requested.wait(timeout=min(_OBS_STARTUP_POLL_INTERVAL, remaining))
+                if startup_interrupted:
+                    break
+            logger.info(f"OBS recording status check: {recording_active}")
+            
+            if startup_interrupted:
+                logger.info("OBS startup wait interrupted by a stop request")
             
             if not recording_active:
                 logger.info("OBS failed to start recording - checking process status")
@@ -305,6 +616,9 @@ class ScreenRecorder:
         Returns:
             True if recording stopped successfully, False otherwise
         """
+        # Wake up a start_recording() call that is still waiting for OBS
+        self._stop_requested.set()
+        
         if not self.is_recording():
             logger.info("No OBS screen recording in progress")
             return False
@@ -312,29 +626,28 @@ class ScreenRecorder:
         try:
             logger.info("Stopping OBS screen recording...")
 
-            system = platform.system()
-            # Simple subprocess kwargs for process control
-            kwargs = {
-                'capture_output': True,
-                'text': True
-            }
-            if platform.system() == "Windows":
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-                kwargs['shell'] = True
-
-            if system == "Windows":
-                # On Windows, try to stop recording first using OBS command line, then quit
-                obs_executable = self._get_obs_executable_path()
-                obs_dir = os.path.dirname(obs_executable)
-
-                # If OBS is still running, force close it
-                check_cmd = ['powershell', '-Command', 'Get-Process obs64 -ErrorAction SilentlyContinue']
-                check_result = subprocess.run(check_cmd, **kwargs)
-                if check_result.returncode == 0:
+            kwargs = _PROCESS_CONTROL_KWARGS
+
+            # Stop through the WebSocket API first: OBS finalizes the file before replying
+            # and reports its path, so the save delay and directory scan can be skipped
+            saved_recording_path = self._stop_obs_websocket_recording()
+            self._close_obs_websocket()
+
+            if _IS_WINDOWS:
+                # Terminate the OBS process we started, without spawning PowerShell
+                stopped = False
+                if self.recording_process is not None and self.recording_process.poll() is None:
+                    try:
+                        self.recording_process.terminate()
+                        self.recording_process.wait(timeout=5)
+                        stopped = True
+                    except Exception as e:
+                        logger.warning(f"Failed to terminate OBS process {self.recording_process.pid}: {e}")
+
+                # OBS was not started by us (or survived terminate), force close it by image name
+                if not stopped:
                     logger.info("OBS still running, force closing...")
-                    force_stop_cmd = ['powershell', '-Command', 
-                                    'Get-Process obs64 -ErrorAction SilentlyContinue | Stop-Process -Force']
-                    subprocess.run(force_stop_cmd, **kwargs)
+                    subprocess.run(['taskkill', '/IM', 'obs64.exe', '/T', '/F'], **kwargs)
 
                 # Remove OBS safe_mode file to prevent safe mode prompt
                 try:
@@ -347,35 +660,34 @@ class ScreenRecorder:
                 except Exception as e:
                     logger.warning(f"Failed to remove OBS safe_mode file: {e}")
 
-            elif system == "Darwin":  # macOS
+            elif _IS_DARWIN:  # macOS
                 # On macOS, use osascript to quit OBS gracefully or pkill as fallback
                 try:
                     # Try graceful quit first
                     quit_cmd = ['osascript', '-e', 'tell application "OBS" to quit']
                     result = subprocess.run(quit_cmd, **kwargs, timeout=5)
                     if result.returncode != 0:
-                        # Fallback to pkill with specific pattern
-                        subprocess.run(['pkill', '-f', '/Applications/OBS.app/Contents/MacOS/OBS'], **kwargs)
+                        # Fallback to terminating the OBS process
+                        if not self._terminate_recording_process():
+                            self._terminate_obs_processes()
                 except subprocess.TimeoutExpired:
                     # Force kill if needed
-                    subprocess.run(['pkill', '-9', '-f', '/Applications/OBS.app/Contents/MacOS/OBS'], **kwargs)
+                    if not self._terminate_recording_process():
+                        self._terminate_obs_processes()
 
             else:  # Linux
-                # On Linux, try graceful shutdown then pkill
+                # On Linux, try graceful shutdown (TERM) then force kill, signalling the OBS
+                # process we started directly and only searching for OBS if it wasn't ours
                 try:
-                    # Try sending TERM signal first
-                    subprocess.run(['pkill', '-TERM', 'obs'], **kwargs)
-                    time.sleep(2)
-                    # Check if still running and force kill if needed
-                    check_result = subprocess.run(['pgrep', 'obs'], **kwargs)
-                    if check_result.returncode == 0:
-                        subprocess.run(['pkill', '-9', 'obs'], **kwargs)
+                    if not self._terminate_recording_process():
+                        self._terminate_obs_processes()
                 except Exception:
                     pass
 
-            # Wait a moment for OBS to fully stop and save the file
-            logger.info("Waiting for OBS to finish saving the recording file...")
-            time.sleep(5)  # Give OBS more time to save the file
+            if saved_recording_path is None and self.recording_start_time:
+                # Wait for OBS to fully stop and save the file (size stops changing)
+                logger.info("Waiting for OBS to finish saving the recording file...")
+                saved_recording_path = self._wait_for_recording_file(self.recording_start_time)
 
             # Try to find and move the recording file from default location
             moved_file_path = None
@@ -385,14 +697,13 @@ class ScreenRecorder:
                     expected_filename = os.path.basename(self.recording_file_path)
                     # Parse participant_id and stage from filename like: screen_recording_PARTICIPANT_stageN_TIMESTAMP.mp4
                     try:
-                        parts = expected_filename.replace('screen_recording_', '').replace('.mp4', '').split('_')
-                        if len(parts) >= 3:
-                            participant_id = parts[0]
-                            stage_part = [p for p in parts if p.startswith('stage')][0]
-                            study_stage = int(stage_part.replace('stage', ''))
+                        match = _RECORDING_FILENAME_RE.match(expected_filename)
+                        if match:
+                            participant_id = match.group('participant_id')
+                            study_stage = int(match.group('stage'))
 
-                            # Find the latest recording file in default locations
-                            source_file = self._find_latest_recording_file(participant_id, study_stage, self.recording_start_time)
+                            # Use the file located while stopping, otherwise find the latest recording file in default locations
+                            source_file = saved_recording_path or self._find_latest_recording_file(participant_id, study_stage, self.recording_start_time)
 
                             if source_file and os.path.exists(source_file):
                                 try:
@@ -402,7 +713,7 @@ class ScreenRecorder:
 
                                     # Move the file from default location to our recordings directory
                                     logger.info(f"Moving recording file from {source_file} to {self.recording_file_path}")
-                                    shutil.move(source_file, self.recording_file_path)
+                                    _move_file(source_file, self.recording_file_path)
                                     moved_file_path = self.recording_file_path
                                     logger.info(f"Successfully moved recording file to: {self.recording_file_path}")
 
@@ -412,7 +723,7 @@ class ScreenRecorder:
                                     moved_file_path = source_file
                             else:
                                 logger.warning(f" Could not find recording file in default OBS locations")
-                                logger.info(f"   Expected to find file created after: {datetime.fromtimestamp(self.recording_start_time)}")
+                                logger.info("   Expected to find file created after: %s", datetime.fromtimestamp(self.recording_start_time))
                     except (ValueError, IndexError, AttributeError) as e:
                         logger.warning(f" Could not parse recording filename for file moving: {e}")
 
@@ -443,27 +754,37 @@ class ScreenRecorder:
         Returns:
             True if OBS recording is active, False otherwise
         """
+        # The WebSocket API reports the recording state directly, without process scans
+        client = self._get_obs_websocket()
+        if client is not None:
+            try:
+                if client.get_record_status().output_active:
+                    return True
+            except Exception as e:
+                logger.debug("OBS WebSocket status request failed: %s", e)
+                self._close_obs_websocket()
+        
         try:
-            system = platform.system()
-            # Simple subprocess kwargs for process checking
-            kwargs = {
-                'capture_output': True,
-                'text': True
-            }
-            
-            if system == "Windows":
+            kwargs = _PROCESS_CONTROL_KWARGS
+            
+            if psutil is not None:
+                # One in-process scan of the process table instead of spawning PowerShell/pgrep
+                obs_processes, has_mux = self._find_obs_processes()
+                is_running = bool(obs_processes)
+                if _IS_DARWIN and is_running:
+                    # obs-ffmpeg-mux indicates active recording but may not always be present
+                    logger.info(f"OBS main process running: {is_running}, obs-ffmpeg-mux active: {has_mux}")
+                
+            elif _IS_WINDOWS:
                 # For Windows, check if obs64 process is running
                 check_cmd = ['powershell', '-Command', 'Get-Process obs64 -ErrorAction SilentlyContinue']
-                if platform.system() == "Windows":
-                    kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-                    kwargs['shell'] = True
                 result = subprocess.run(check_cmd, **kwargs)
                 is_running = result.returncode == 0
                 
-            elif system == "Darwin":  # macOS
+            elif _IS_DARWIN:  # macOS
                 # For macOS, check specifically for the main OBS application process
                 # Use more specific pattern to avoid matching obs-ffmpeg-mux
-                check_cmd = ['pgrep', '-f', '/Applications/OBS.app/Contents/MacOS/OBS']
+                check_cmd = ['pgrep', '-f', _MACOS_OBS_EXECUTABLE]
                 result = subprocess.run(check_cmd, **kwargs)
                 is_running = result.returncode == 0
                 
@@ -478,10 +799,8 @@ class ScreenRecorder:
                     return is_running
                 
             else:  # Linux
-                # For Linux, check if obs process is running
-                check_cmd = ['pgrep', 'obs']
-                result = subprocess.run(check_cmd, **kwargs)
-                is_running = result.returncode == 0
+                # For Linux, check if obs process is running by reading /proc instead of forking pgrep
+                is_running = self._proc_has_obs_process()
                 
             return is_running
                 
@@ -489,6 +808,112 @@ class ScreenRecorder:
             logger.info(f"Error checking OBS recording status: {e}")
             return False
     
+    def _find_obs_processes(self) -> Tuple[List[Any], bool]:
+        """
+        Find running OBS processes with a single psutil scan.
+        
+        Returns:
+            Tuple of (main OBS psutil.Process objects, whether obs-ffmpeg-mux is running)
+        """
+        obs_processes = []
+        has_mux = False
+        # Command lines are only needed to match the macOS app bundle and are costly to read
+        attrs = ['name', 'cmdline'] if _IS_DARWIN else ['name']
+        for proc in psutil.process_iter(attrs):
+            name = proc.info['name'] or ''
+            if name == 'obs-ffmpeg-mux':
+                has_mux = True
+            elif _IS_WINDOWS:
+                if name.lower() == 'obs64.exe':
+                    obs_processes.append(proc)
+            elif _IS_DARWIN:
+                # Match the app bundle executable like `pgrep -f` did, so helpers aren't included
+                if any(_MACOS_OBS_EXECUTABLE in arg for arg in proc.info['cmdline'] or ()):
+                    obs_processes.append(proc)
+            elif name == 'obs':
+                obs_processes.append(proc)
+        return obs_processes, has_mux
+    
+    def _proc_has_obs_process(self) -> bool:
+        """
+        Check /proc for a running OBS process on Linux when psutil is not installed.
+        
+        Returns:
+            True if a process named 'obs' is running, False otherwise
+        """
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/comm', 'r', encoding='utf-8', errors='replace') as f:
+                        if f.read().strip() == 'obs':
+                            return True
+                except OSError:
+                    # Process exited during the scan or is not readable
+                    continue
+        return False
+    
+    def _terminate_recording_process(self, timeout: float = 3) -> bool:
+        """
+        Terminate the OBS process started by start_recording() on macOS/Linux by signalling
+        its process group, force killing it if it doesn't exit within the timeout.
+        
+        Args:
+            timeout: Seconds to wait for OBS to exit after SIGTERM
+            
+        Returns:
+            True if the tracked OBS process has exited, False if there was none to stop
+        """
+        process = self.recording_process
+        if process is None or process.poll() is not None:
+            return False
+        
+        # start_recording() launches OBS in a new session, so its pid is also the process group id
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logger.info("OBS did not exit after SIGTERM, force killing...")
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            process.wait()
+        except OSError as e:
+            logger.warning(f"Failed to signal OBS process group {process.pid}: {e}")
+            return False
+        return True
+    
+    def _terminate_obs_processes(self, timeout: float = 2):
+        """
+        Terminate running OBS processes on macOS/Linux, force killing any that
+        don't exit within the timeout.
+        
+        Args:
+            timeout: Seconds to wait for OBS to exit after SIGTERM
+        """
+        if psutil is None:
+            pattern = ['-f', _MACOS_OBS_EXECUTABLE] if _IS_DARWIN else ['obs']
+            subprocess.run(['pkill', '-TERM', *pattern], **_PROCESS_CONTROL_KWARGS)
+            time.sleep(timeout)
+            if subprocess.run(['pgrep', *pattern], **_PROCESS_CONTROL_KWARGS).returncode == 0:
+                subprocess.run(['pkill', '-9', *pattern], **_PROCESS_CONTROL_KWARGS)
+            return
+        
+        obs_processes, _ = self._find_obs_processes()
+        for proc in obs_processes:
+            try:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+        _, alive = psutil.wait_procs(obs_processes, timeout=timeout)
+        for proc in alive:
+            try:
+                proc.kill()
+            except psutil.NoSuchProcess:
+                pass
+    
     def _get_recording_subprocess_kwargs(self) -> Dict[str, Any]:
         """
         Get subprocess keyword arguments for recording processes.
@@ -496,19 +921,8 @@ class ScreenRecorder:
         Returns:
             Dictionary of keyword arguments for subprocess.Popen()
         """
-        kwargs = {
-            'stdout': subprocess.PIPE,
-            'stderr': subprocess.PIPE
-        }
-        
-        # Platform-specific settings
-        if platform.system() == "Windows":
-            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            kwargs['shell'] = True
-        else:
-            kwargs['preexec_fn'] = os.setsid
-        
-        return kwargs
+        # Copy, since callers add per-call options such as cwd
+        return dict(_RECORDING_SUBPROCESS_KWARGS)
     
     def upload_to_azure_blob(self, file_path: str, blob_container: str = "recordings", 
                            storage_account: str = "codingstudybackup") -> bool:
@@ -534,28 +948,12 @@ class ScreenRecorder:
             
             logger.info(f"Uploading {filename} to Azure Blob Storage...")
             
-            # Get subprocess kwargs for cross-platform compatibility
-            kwargs = self._get_recording_subprocess_kwargs()
-            kwargs['timeout'] = 300  # 5 minute timeout for large files
-            
-            # Step 1: Login to Azure using managed identity
-            logger.info("Authenticating with Azure using managed identity...")
-            login_cmd = ['azcopy', 'login', '--identity']
-            
-            login_result = subprocess.run(login_cmd, **kwargs)
-            if login_result.returncode != 0:
-                logger.error(f"Azure login failed: {login_result.stderr}")
-                return False
-            
-            logger.info("✅ Successfully authenticated with Azure")
-            
-            # Step 2: Upload the file
+            # azcopy authenticates with managed identity itself (AZCOPY_AUTO_LOGIN_TYPE=MSI),
+            # so the upload is a single process without a separate login step
             logger.info(f"Copying file to blob: {blob_url}")
-            copy_cmd = ['azcopy', 'copy', file_path, blob_url]
-            
-            copy_result = subprocess.run(copy_cmd, **kwargs)
-            if copy_result.returncode != 0:
-                logger.error(f"Azure upload failed: {copy_result.stderr}")
+            returncode, output = self._run_azcopy(['copy', file_path, blob_url])
+            if returncode != 0:
+                logger.error(f"Azure upload failed: {output}")
                 return False
             
             logger.info(f"Successfully uploaded {filename} to Azure Blob Storage")
@@ -573,6 +971,59 @@ class ScreenRecorder:
             logger.error(f"Error uploading to Azure Blob Storage: {e}")
             return False
     
+    def _run_azcopy(self, args: List[str], timeout: float = 300) -> Tuple[int, str]:
+        """
+        Run azcopy, streaming its output to the debug log line by line instead of
+        buffering the whole transfer log in memory.
+        
+        Args:
+            args: azcopy arguments (without the executable)
+            timeout: Seconds after which azcopy is killed (default: 5 minutes for large files)
+            
+        Returns:
+            Tuple of (exit code, last lines of azcopy output)
+            
+        Raises:
+            subprocess.TimeoutExpired: If azcopy did not finish within the timeout
+        """
+        # Get subprocess kwargs for cross-platform compatibility, with stderr merged into stdout
+        kwargs = self._get_recording_subprocess_kwargs()
+        kwargs.update(stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors='replace', bufsize=1)
+        kwargs['env'] = {**os.environ, 'AZCOPY_AUTO_LOGIN_TYPE': 'MSI'}
+        
+        process = subprocess.Popen(['azcopy', *args], **kwargs)
+        timed_out = threading.Event()
+        
+        def _kill_on_timeout():
+            timed_out.set()
+            if _IS_WINDOWS:
+                process.kill()
+            else:
+                # azcopy runs in its own session, so kill the whole group
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+        
+        # The timer also fires while azcopy is silent, so reading output never hangs forever
+        timer = threading.Timer(timeout, _kill_on_timeout)
+        timer.start()
+        tail = deque(maxlen=20)
+        try:
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    logger.debug("azcopy: %s", line)
+                    tail.append(line)
+            returncode = process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        return returncode, "\n".join(tail)
+    
     def upload_recording_to_azure(self, participant_id: str, study_stage: int) -> bool:
         """
         Upload the current recording file to Azure Blob Storage and optionally remove local file.
@@ -584,18 +1035,43 @@ class ScreenRecorder:
         Returns:
             True if upload was successful, False otherwise
         """
-        if not self.recording_file_path:
+        recording_file_path = self.recording_file_path
+        success = self._upload_recording_file(participant_id, study_stage, recording_file_path,
+                                              self.recording_start_time)
+        if success and self.recording_file_path == recording_file_path:
+            # Clear the stored file path after successful upload
+            self.recording_file_path = None
+        return success
+    
+    def _upload_recording_file(self, participant_id: str, study_stage: int,
+                               recording_file_path: Optional[str],
+                               recording_start_time: Optional[float]) -> bool:
+        """
+        Upload a recording file to Azure Blob Storage without touching the recorder state,
+        so it can run on the upload pool while the next recording starts.
+        
+        Args:
+            participant_id: The participant's unique identifier
+            study_stage: The study stage the recording belongs to
+            recording_file_path: Expected path of the recording file
+            recording_start_time: When the recording started, used to look for the file
+                in the OBS default locations if it isn't at recording_file_path
+            
+        Returns:
+            True if upload was successful, False otherwise
+        """
+        if not recording_file_path:
             logger.info("❌ No recording file path available for Azure upload")
             return False
         
         # Check if the file exists (it might have been moved by stop_recording)
         file_to_upload = None
-        if os.path.exists(self.recording_file_path):
-            file_to_upload = self.recording_file_path
+        if os.path.exists(recording_file_path):
+            file_to_upload = recording_file_path
         else:
             # Try to find the file in default OBS locations
-            if self.recording_start_time:
-                found_file = self._find_latest_recording_file(participant_id, study_stage, self.recording_start_time)
+            if recording_start_time:
+                found_file = self._find_latest_recording_file(participant_id, study_stage, recording_start_time)
                 if found_file and os.path.exists(found_file):
                     file_to_upload = found_file
                     logger.info(f"Found recording file at: {found_file}")
@@ -609,8 +1085,6 @@ class ScreenRecorder:
         
         if success:
             logger.info(f"Recording for participant {participant_id}, stage {study_stage} uploaded to Azure")
-            # Clear the stored file path after successful upload
-            self.recording_file_path = None
             # Optionally remove local file after successful upload
             # Uncomment the following lines if you want to delete local files after upload:
             # try:
@@ -623,25 +1097,202 @@ class ScreenRecorder:
         
         return success
     
+    def upload_recording_to_azure_async(self, participant_id: str, study_stage: int) -> Future:
+        """
+        Upload the current recording file to Azure Blob Storage on a background thread.
+        The recording path is captured now, so a recording started before the upload
+        runs isn't affected.
+        
+        Args:
+            participant_id: The participant's unique identifier
+            study_stage: The current study stage
+            
+        Returns:
+            Future resolving to True if upload was successful, False otherwise
+        """
+        with self._pending_uploads_lock:
+            if not self._upload_drain_registered:
+                # Registered on first use (after logging is set up) so the drain runs before
+                # the log listener stops, and also when the app isn't run as __main__
+                atexit.register(self._drain_uploads_at_exit)
+                self._upload_drain_registered = True
+            future = self._post_stop_pool.submit(self._upload_recording_file, participant_id, study_stage,
+                                                 self.recording_file_path, self.recording_start_time)
+            self._pending_uploads = [f for f in self._pending_uploads if not f.done()]
+            self._pending_uploads.append(future)
+        return future
+    
+    def wait_for_pending_uploads(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background uploads started with upload_recording_to_azure_async().
+        
+        Args:
+            timeout: Maximum seconds to wait (default: wait until all are done)
+            
+        Returns:
+            True if all pending uploads finished, False if the timeout expired first
+        """
+        with self._pending_uploads_lock:
+            pending = list(self._pending_uploads)
+        if not pending:
+            return True
+        
+        logger.info(f"Waiting for {len(pending)} pending recording upload(s) to finish...")
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+    
+    def _drain_uploads_at_exit(self):
+        """Finish pending uploads and shut down the upload pool when the interpreter exits."""
+        self.wait_for_pending_uploads()
+        self._post_stop_pool.shutdown(wait=True)
+    
+
+class JsonlLogWriter:
+    """
+    Buffered append-only writer for JSONL tracker logs.
+    Events are queued in memory and written in batches to limit write syscalls
+    during bursts of activity. The log is rotated when it grows beyond max_bytes
+    or the day changes, so no single file grows without bound.
+    """
+    def __init__(self, log_path: str, flush_max_events: int = 32, flush_interval: float = 5.0,
+                 max_bytes: int = DEFAULT_MAX_LOG_BYTES, max_pending_events: int = 10_000):
+        self.log_path = log_path
+        self.flush_max_events = flush_max_events
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        # Bounded so a stalled disk drops the oldest events instead of exhausting memory
+        self._pending = deque(maxlen=max_pending_events)
+        self._dropped = 0
+        self._fd = None
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._bytes_written = 0
+        self._current_date = None
+
+    def open(self):
+        """Open the log file for appending."""
+        with self._lock:
+            if self._fd is None:
+                self._open_locked()
+                self._last_flush = time.monotonic()
+
+    def _open_locked(self):
+        # Raw O_APPEND descriptor: each os.write lands at the end of the file without
+        # going through Python's buffered file layer
+        self._fd = os.open(self.log_path, _LOG_OPEN_FLAGS, 0o644)
+        self._bytes_written = os.fstat(self._fd).st_size
+        self._current_date = date.today()
+
+    def _rotate_locked(self):
+        """
+        Move the current log aside as a timestamped part and start a fresh file.
+        If the rename fails (e.g. the file is locked by a virus scanner on Windows),
+        the original file is reopened and appending continues there.
+        """
+        root, ext = os.path.splitext(self.log_path)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        rotated_path = f"{root}_{timestamp}{ext}"
+        part = 1
+        while os.path.exists(rotated_path):
+            rotated_path = f"{root}_{timestamp}_{part}{ext}"
+            part += 1
+        # Windows can't rename a file that is still open, so close it first
+        os.close(self._fd)
+        self._fd = None
+        try:
+            os.replace(self.log_path, rotated_path)
+            logger.info(f"Rotated tracker log to: {rotated_path}")
+        except OSError as e:
+            logger.warning(f"Could not rotate tracker log {self.log_path}, continuing in the current file: {e}")
+        finally:
+            self._open_locked()
+
+    def close(self):
+        """Write any pending events and close the log file."""
+        with self._lock:
+            self._flush_locked()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def append(self, event: Dict[str, Any]):
+        """Queue an event for the next batch write."""
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+            self._pending.append(event)
+
+    def flush_if_due(self):
+        """Write pending events if enough have accumulated or the flush interval has passed."""
+        with self._lock:
+            if self._dropped:
+                logger.warning(f"Dropped {self._dropped} events for {self.log_path} due to write backpressure")
+                self._dropped = 0
+            if not self._pending:
+                return
+            if (len(self._pending) >= self.flush_max_events
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def flush(self):
+        """Write all pending events now."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._fd is None or not self._pending:
+            return
+        # Start a new file when the day changes so each part covers a single day
+        if date.today() != self._current_date and self._bytes_written > 0:
+            self._rotate_locked()
+        data = b"".join(encode_jsonl_line(event) for event in self._pending)
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        self._bytes_written += len(data)
+        if self._bytes_written >= self.max_bytes:
+            self._rotate_locked()
+
+
+class WindowInfo(NamedTuple):
+    """Application and window title of the focused window."""
+    application: str
+    window_title: str
+
 
 class FocusTracker:
     """
     Cross-platform window focus tracker for study participants.
-    Logs application/window focus changes to a JSON file.
+    Logs application/window focus changes to a JSONL file (one event per line).
     """
-    def __init__(self, logs_directory: str, study_stage: int, poll_interval: float = 1.0):
+    def __init__(self, logs_directory: str, study_stage: int, poll_interval: float = 1.0,
+                 max_log_bytes: int = DEFAULT_MAX_LOG_BYTES):
         self.logs_directory = logs_directory
         self.study_stage = study_stage
         self.poll_interval = poll_interval
-        self.focus_log_path = os.path.join(logs_directory, f"focus_log_stage{study_stage}.json")
+        self.focus_log_path = os.path.join(logs_directory, f"focus_log_stage{study_stage}.jsonl")
         self._stop_event = threading.Event()
         self._thread = None
         self._last_focus = None
+        # Wall-clock timestamp and monotonic start of the window currently in focus
+        self._last_focus_timestamp = None
+        self._last_focus_started = 0.0
+        self._log_writer = JsonlLogWriter(self.focus_log_path, max_bytes=max_log_bytes)
+        # pid -> (create_time, process name), bounded LRU to avoid repeated name lookups
+        self._pid_name_cache: "OrderedDict[int, Tuple[float, str]]" = OrderedDict()
+        # Persistent X11 connection for Linux focus queries (opened lazily by the tracking thread)
+        self._x_display = None
+        self._get_window_impl = self._select_window_backend()
+        os.makedirs(self.logs_directory, exist_ok=True)
 
     def start(self):
         if self._thread and self._thread.is_alive():
             return
         self._stop_event.clear()
+        self._log_writer.open()
         self._thread = threading.Thread(target=self._track_focus_loop, daemon=True)
         self._thread.start()
 
@@ -649,113 +1300,263 @@ class FocusTracker:
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2)
+        # Record the window that was still in focus when tracking stopped
+        self._end_current_focus(time.monotonic())
+        try:
+            self._log_writer.close()
+        except Exception as e:
+            logger.warning(f"Failed to write focus events on stop: {e}")
+        self._close_x_display()
 
     def _track_focus_loop(self):
         while not self._stop_event.is_set():
             focus_info = self._get_active_window_info()
             # Only log if changed compared to last value
             if focus_info is not None:
-                if not self._last_focus or not self._focus_equal(focus_info, self._last_focus):
-                    self._log_focus_event(focus_info)
+                # Plain tuple comparison; the event dict is only built when the focus ends
+                if focus_info != self._last_focus:
+                    now = time.monotonic()
+                    self._end_current_focus(now)
                     self._last_focus = focus_info
-            time.sleep(self.poll_interval)
+                    self._last_focus_timestamp = _utc_timestamp()
+                    self._last_focus_started = now
+            self._flush_log()
+            if self._stop_event.wait(self.poll_interval):
+                break
 
-    def _focus_equal(self, a: dict, b: dict) -> bool:
-        # Compare application and window_title for equality
-        return a.get("application") == b.get("application") and a.get("window_title") == b.get("window_title")
+    def flush(self):
+        """Write any buffered focus events to disk."""
+        try:
+            self._log_writer.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush focus events: {e}")
 
-    def _get_active_window_info(self) -> Optional[Dict[str, str]]:
-        system = platform.system()
+    def _flush_log(self):
         try:
-            if system == "Darwin":
-                # macOS: Use osascript to get frontmost app and window title
-                script = 'tell application "System Events"\nset frontApp to name of first application process whose frontmost is true\nend tell\nreturn frontApp'
-                app_proc = subprocess.run(["osascript", "-e", script], capture_output=True, text=True)
-                app_name = app_proc.stdout.strip() if app_proc.returncode == 0 else None
-                # Window title (optional, may require accessibility permissions)
-                title_script = 'tell application "System Events"\nset frontApp to first application process whose frontmost is true\ntry\nset window_name to name of front window of frontApp\non error\nset window_name to ""\nend try\nend tell\nreturn window_name'
-                title_proc = subprocess.run(["osascript", "-e", title_script], capture_output=True, text=True)
-                window_title = title_proc.stdout.strip() if title_proc.returncode == 0 else ""
-                if app_name:
-                    return {"application": app_name, "window_title": window_title}
-            elif system == "Windows":
-                try:
-                    import win32gui
-                    import win32process
-                    import psutil
-                    hwnd = win32gui.GetForegroundWindow()
-                    window_title = win32gui.GetWindowText(hwnd)
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    proc = psutil.Process(pid)
-                    app_name = proc.name()
-                    return {"application": app_name, "window_title": window_title}
-                except ImportError:
-                    return None
-            elif system == "Linux":
-                # Linux: Use xdotool (must be installed)
-                try:
-                    win_id = subprocess.check_output(["xdotool", "getactivewindow"], text=True).strip()
-                    window_title = subprocess.check_output(["xdotool", "getwindowname", win_id], text=True).strip()
-                    # Try to get process name (optional, may require xprop)
-                    app_name = ""
-                    try:
-                        wm_class = subprocess.check_output(["xprop", "-id", win_id, "WM_CLASS"], text=True)
-                        if 'WM_CLASS' in wm_class:
-                            app_name = wm_class.split('=')[-1].strip().strip('"')
-                    except Exception:
-                        pass
-                    return {"application": app_name, "window_title": window_title}
-                except Exception:
-                    return None
+            self._log_writer.flush_if_due()
+        except Exception as e:
+            logger.warning(f"Failed to log focus events: {e}")
+
+    def _get_active_window_info(self) -> Optional[WindowInfo]:
+        try:
+            return self._get_window_impl()
         except Exception:
             return None
+
+    def _select_window_backend(self) -> Callable[[], Optional[WindowInfo]]:
+        """
+        Pick the focus query implementation for this platform once, so the
+        tracking loop calls a single function without re-checking the platform.
+        
+        Returns:
+            Callable returning the focused window (or None)
+        """
+        if _IS_DARWIN:
+            # macOS: Prefer in-process Cocoa/Quartz calls over spawning osascript
+            if _HAVE_PYOBJC:
+                return self._get_active_window_info_macos
+            return self._get_active_window_info_osascript
+        elif _IS_WINDOWS:
+            if _HAVE_WIN32 and psutil is not None:
+                return self._get_active_window_info_win32
+        elif _IS_LINUX:
+            # Linux: Prefer a persistent X connection over spawning xdotool/xprop
+            if _HAVE_XLIB:
+                return self._get_active_window_info_xlib
+            return self._get_active_window_info_xdotool
+        return lambda: None
+
+    def _get_active_window_info_osascript(self) -> Optional[WindowInfo]:
+        """
+        Get the frontmost application and window title on macOS via osascript
+        (single script so only one osascript process is spawned per check).
+        """
+        proc = subprocess.run(["osascript", "-e", _MACOS_FOCUS_SCRIPT], capture_output=True, text=True)
+        if proc.returncode == 0:
+            app_name, _, window_title = proc.stdout.rstrip("\n").partition("\n")
+            if app_name.strip():
+                return WindowInfo(app_name.strip(), window_title.strip())
         return None
 
-    def _log_focus_event(self, focus_info: Dict[str, str]):
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "application": focus_info.get("application", ""),
-            "window_title": focus_info.get("window_title", "")
-        }
+    def _get_active_window_info_win32(self) -> Optional[WindowInfo]:
+        """Get the foreground window title and its process name on Windows."""
+        hwnd = win32gui.GetForegroundWindow()
+        window_title = win32gui.GetWindowText(hwnd)
+        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+        app_name = self._get_process_name(pid)
+        return WindowInfo(app_name, window_title)
+
+    def _get_active_window_info_xdotool(self) -> Optional[WindowInfo]:
+        """
+        Get the active window on Linux using xdotool (must be installed).
+        A single chained xdotool call prints the window title and pid; the
+        application name is then read from /proc instead of spawning ps/xprop.
+        """
         try:
-            if not os.path.exists(self.logs_directory):
-                os.makedirs(self.logs_directory, exist_ok=True)
-            if os.path.exists(self.focus_log_path):
-                with open(self.focus_log_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {"focus_events": []}
-            data["focus_events"].append(event)
-            with open(self.focus_log_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            proc = subprocess.run(["xdotool", "getactivewindow", "getwindowname", "getwindowpid"],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        except Exception:
+            return None
+        # getwindowpid fails for windows without _NET_WM_PID, but the title is still printed
+        lines = proc.stdout.splitlines()
+        if not lines:
+            return None
+        window_title = lines[0].strip()
+        app_name = ""
+        if len(lines) > 1 and lines[1].strip().isdigit():
+            try:
+                with open(f"/proc/{lines[1].strip()}/comm", "r") as f:
+                    app_name = f.read().strip()
+            except OSError:
+                pass
+        return WindowInfo(app_name, window_title)
+
+    def _get_active_window_info_macos(self) -> Optional[WindowInfo]:
+        """
+        Get the frontmost application and window title on macOS using PyObjC.
+        
+        Returns:
+            WindowInfo, or None if no app is frontmost
+        """
+        app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        if app is None:
+            return None
+        app_name = str(app.localizedName() or "")
+        pid = app.processIdentifier()
+        window_title = ""
+        # Window title (may be empty without screen recording permission)
+        windows = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID) or []
+        for window in windows:
+            if window.get("kCGWindowOwnerPID") == pid and window.get("kCGWindowLayer") == 0:
+                window_title = str(window.get("kCGWindowName") or "")
+                break
+        if not app_name:
+            return None
+        return WindowInfo(app_name, window_title)
+
+    def _open_x_display(self):
+        """Open the X display and intern the atoms used for focus queries."""
+        try:
+            x_display = xdisplay.Display()
         except Exception as e:
-            logger.warning(f"Failed to log focus event: {e}")
+            # No X server (headless / Wayland)
+            logger.debug("Xlib display not available, falling back to xdotool: %s", e)
+            self._get_window_impl = self._get_active_window_info_xdotool
+            return
+        self._x_display = x_display
+        self._x_root = x_display.screen().root
+        self._net_active_window = x_display.intern_atom('_NET_ACTIVE_WINDOW')
+        self._net_wm_name = x_display.intern_atom('_NET_WM_NAME')
+        self._utf8_string = x_display.intern_atom('UTF8_STRING')
+
+    def _close_x_display(self):
+        """Close the persistent X display, if open."""
+        if self._x_display is not None:
+            try:
+                self._x_display.close()
+            except Exception:
+                pass
+            self._x_display = None
+
+    def _get_active_window_info_xlib(self) -> Optional[WindowInfo]:
+        """
+        Get the active window's application class and title via Xlib.
+        
+        Returns:
+            WindowInfo, or None if no window is active
+        """
+        if self._x_display is None:
+            self._open_x_display()
+            if self._x_display is None:
+                return self._get_active_window_info_xdotool()
+        active = self._x_root.get_full_property(self._net_active_window, X.AnyPropertyType)
+        if active is None or not active.value or not active.value[0]:
+            return None
+        window = self._x_display.create_resource_object('window', active.value[0])
+        name_prop = window.get_full_property(self._net_wm_name, self._utf8_string)
+        if name_prop is not None:
+            window_title = name_prop.value
+            if isinstance(window_title, bytes):
+                window_title = window_title.decode('utf-8', 'replace')
+        else:
+            window_title = window.get_wm_name() or ""
+        wm_class = window.get_wm_class()
+        app_name = wm_class[1] if wm_class else ""
+        return WindowInfo(app_name, window_title)
+
+    def _get_process_name(self, pid: int) -> str:
+        """
+        Get the process name for a pid, reusing the cached name while the pid
+        still refers to the same process (same creation time).
+        """
+        proc = psutil.Process(pid)
+        create_time = proc.create_time()
+        cached = self._pid_name_cache.get(pid)
+        if cached is not None and cached[0] == create_time:
+            self._pid_name_cache.move_to_end(pid)
+            return cached[1]
+        app_name = proc.name()
+        self._pid_name_cache[pid] = (create_time, app_name)
+        if len(self._pid_name_cache) > _PID_NAME_CACHE_SIZE:
+            self._pid_name_cache.popitem(last=False)
+        return app_name
+
+    def _end_current_focus(self, now: float):
+        """Log the window currently in focus together with how long it stayed focused."""
+        if self._last_focus is None:
+            return
+        duration_ms = int((now - self._last_focus_started) * 1000)
+        self._log_focus_event(self._last_focus, self._last_focus_timestamp, duration_ms)
+        self._last_focus = None
+
+    def _log_focus_event(self, focus_info: WindowInfo, timestamp: str, duration_ms: int):
+        event = {
+            "timestamp": timestamp,
+            "application": focus_info.application,
+            "window_title": focus_info.window_title,
+            "duration_ms": duration_ms
+        }
+        self._log_writer.append(event)
 
 
 class ClipboardTracker:
     """
     Cross-platform clipboard content tracker for study participants.
-    Logs clipboard content changes to a JSON file.
+    Logs clipboard content changes to a JSONL file (one event per line).
     """
-    def __init__(self, logs_directory: str, study_stage: int, poll_interval: float = 1.0):
+    def __init__(self, logs_directory: str, study_stage: int, poll_interval: float = 1.0,
+                 max_content_length: int = 8192, max_log_bytes: int = DEFAULT_MAX_LOG_BYTES,
+                 max_poll_interval: float = 10.0):
         self.logs_directory = logs_directory
         self.study_stage = study_stage
         self.poll_interval = poll_interval
-        self.clipboard_log_path = os.path.join(logs_directory, f"clipboard_log_stage{study_stage}.json")
+        # Upper bound for the idle backoff of the polling interval (pyperclip fallback only)
+        self.max_poll_interval = max_poll_interval
+        self._current_interval = poll_interval
+        # Longer clipboard content is truncated in the log (original length is still recorded)
+        self.max_content_length = max_content_length
+        self.clipboard_log_path = os.path.join(logs_directory, f"clipboard_log_stage{study_stage}.jsonl")
         self._stop_event = threading.Event()
         self._thread = None
-        self._last_clipboard_content = None
+        # Digest of the last logged content, so large clipboard text isn't kept in memory
+        self._last_clipboard_digest = None
+        self._log_writer = JsonlLogWriter(self.clipboard_log_path, max_bytes=max_log_bytes)
+        self._change_counter = self._get_change_counter()
+        self._clipboard_reader = self._get_native_clipboard_reader()
+        self._last_change_count = None
+        os.makedirs(self.logs_directory, exist_ok=True)
 
     def start(self):
         """Start the clipboard monitoring thread."""
         if self._thread and self._thread.is_alive():
             return
         
-        if pyperclip is None:
-            logger.warning("pyperclip package not available. Clipboard tracking disabled.")
+        if self._clipboard_reader is None and pyperclip is None:
+            logger.warning("No clipboard backend available (native API or pyperclip). Clipboard tracking disabled.")
             return
             
         self._stop_event.clear()
+        self._log_writer.open()
         self._thread = threading.Thread(target=self._track_clipboard_loop, daemon=True)
         self._thread.start()
         logger.info(f"Started clipboard tracking for stage {self.study_stage}")
@@ -765,69 +1566,152 @@ class ClipboardTracker:
         self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2)
+        try:
+            self._log_writer.close()
+        except Exception as e:
+            logger.warning(f"Failed to write clipboard events on stop: {e}")
         logger.info(f"Stopped clipboard tracking for stage {self.study_stage}")
 
     def _track_clipboard_loop(self):
         """Main loop for tracking clipboard changes."""
         try:
             while not self._stop_event.is_set():
+                changed = False
                 try:
-                    # Get current clipboard content
-                    current_content = self._get_clipboard_content()
-                    
-                    # Only log if content changed
-                    if current_content is not None and current_content != self._last_clipboard_content:
-                        self._log_clipboard_event(current_content)
-                        self._last_clipboard_content = current_content
-                        
+                    changed = self._poll_clipboard()
                 except Exception as e:
                     logger.warning(f"Error reading clipboard: {e}")
                 
-                time.sleep(self.poll_interval)
+                try:
+                    self._log_writer.flush_if_due()
+                except Exception as e:
+                    logger.warning(f"Failed to log clipboard events: {e}")
+                
+                # With a change counter an idle tick is one integer compare, so keep the full rate
+                # and don't miss copies; only the pyperclip fallback backs off while idle
+                if changed or self._change_counter is not None:
+                    self._current_interval = self.poll_interval
+                else:
+                    self._current_interval = min(self._current_interval * 1.5, self.max_poll_interval)
+                self._stop_event.wait(self._current_interval)
                 
         except Exception as e:
             logger.error(f"Error in clipboard tracking loop: {e}")
 
+    def _poll_clipboard(self) -> bool:
+        """
+        Read the clipboard once and log it if the content changed.
+        
+        Returns:
+            True if a new clipboard event was logged, False otherwise
+        """
+        # Skip reading the clipboard if the OS reports no change since the last tick
+        change_count = None
+        if self._change_counter is not None:
+            change_count = self._change_counter()
+            if change_count == self._last_change_count:
+                return False
+        
+        # Get current clipboard content
+        current_content = self._get_clipboard_content()
+        
+        if current_content is None:
+            # Keep the old change count so a failed read (e.g. clipboard locked by another app) is retried
+            return False
+        self._last_change_count = change_count
+        
+        # Only log if content changed
+        digest = hashlib.blake2b(current_content.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        if digest == self._last_clipboard_digest:
+            return False
+        self._log_clipboard_event(current_content)
+        self._last_clipboard_digest = digest
+        return True
+
+    def flush(self):
+        """Write any buffered clipboard events to disk."""
+        try:
+            self._log_writer.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush clipboard events: {e}")
+
+    def _get_change_counter(self) -> Optional[Callable[[], int]]:
+        """
+        Get a cheap OS clipboard change counter, if the platform provides one.
+        
+        Returns:
+            Callable returning a number that changes whenever the clipboard changes,
+            or None to fall back to reading the clipboard on every poll
+        """
+        if _IS_WINDOWS and _HAVE_WIN32:
+            return win32clipboard.GetClipboardSequenceNumber
+        elif _IS_DARWIN and _HAVE_PYOBJC:
+            return NSPasteboard.generalPasteboard().changeCount
+        logger.debug("Native clipboard change counter not available, polling clipboard content")
+        return None
+
+    def _get_native_clipboard_reader(self) -> Optional[Callable[[], Optional[str]]]:
+        """
+        Get an in-process clipboard text reader for the current platform.
+        
+        Returns:
+            Callable returning the clipboard text (or None), or None to fall back to pyperclip
+        """
+        if _IS_WINDOWS and _HAVE_WIN32:
+            def read_windows_clipboard() -> Optional[str]:
+                # Another app may have the clipboard open for a moment, so retry briefly (as pyperclip does)
+                for attempt in range(_CLIPBOARD_OPEN_ATTEMPTS):
+                    try:
+                        win32clipboard.OpenClipboard()
+                        break
+                    except pywintypes.error:
+                        if attempt == _CLIPBOARD_OPEN_ATTEMPTS - 1:
+                            raise
+                        time.sleep(_CLIPBOARD_OPEN_RETRY_DELAY)
+                try:
+                    if not win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+                        return None
+                    return win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
+                finally:
+                    win32clipboard.CloseClipboard()
+            
+            return read_windows_clipboard
+        elif _IS_DARWIN and _HAVE_PYOBJC:
+            pasteboard = NSPasteboard.generalPasteboard()
+            
+            def read_macos_clipboard() -> Optional[str]:
+                content = pasteboard.stringForType_(NSPasteboardTypeString)
+                return str(content) if content is not None else None
+            
+            return read_macos_clipboard
+        logger.debug("Native clipboard API not available, using pyperclip")
+        return None
+
     def _get_clipboard_content(self) -> Optional[str]:
         """Get current clipboard content."""
         try:
-            if pyperclip:
+            if self._clipboard_reader is not None:
+                content = self._clipboard_reader()
+            elif pyperclip:
                 # Try to get text content from clipboard
                 content = pyperclip.paste()
-                if content and content.strip():
-                    return content
+            else:
+                return None
+            if content and content.strip():
+                return content
         except Exception as e:
-            logger.debug(f"Could not read clipboard content: {e}")
+            logger.debug("Could not read clipboard content: %s", e)
         return None
 
     def _log_clipboard_event(self, content: str):
-        """Log a clipboard change event to the JSON file."""
+        """Append a clipboard change event to the JSONL file."""
+        truncated = len(content) > self.max_content_length
         event = {
-            "timestamp": datetime.now().isoformat(),
-            "content": content,
-            "content_length": len(content)
+            "timestamp": _utc_timestamp(),
+            "content": content[:self.max_content_length] if truncated else content,
+            "content_length": len(content),
+            "truncated": truncated
         }
         
-        try:
-            # Ensure logs directory exists
-            if not os.path.exists(self.logs_directory):
-                os.makedirs(self.logs_directory, exist_ok=True)
-            
-            # Load existing data or create new structure
-            if os.path.exists(self.clipboard_log_path):
-                with open(self.clipboard_log_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {"clipboard_events": []}
-            
-            # Add new event
-            data["clipboard_events"].append(event)
-            
-            # Write back to file
-            with open(self.clipboard_log_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
-            logger.debug(f"Logged clipboard event: {len(content)} characters")
-            
-        except Exception as e:
-            logger.warning(f"Failed to log clipboard event: {e}")
+        self._log_writer.append(event)
+        logger.debug("Logged clipboard event: %d characters", len(content))
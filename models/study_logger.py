@@ -17,23 +17,102 @@ Requirements:
 - For Linux: Available as "obs" command in PATH
 """
 
+import atexit
 import os
+import hashlib
 import json
+import time
+import queue
+import shutil
+import tarfile
+import threading
 import subprocess
 import platform
 import zipfile
 import logging
-import random
-import logging
+import secrets
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .github_service import GitHubService
 from .global_git_lock import get_participant_git_lock
-from .screen_recorder import ScreenRecorder, FocusTracker, ClipboardTracker
+from .screen_recorder import ScreenRecorder, FocusTracker, ClipboardTracker, encode_jsonl_line, iter_jsonl_events
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Host platform, resolved once (platform.system() calls uname() on every use)
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_IS_DARWIN = _SYSTEM == "Darwin"
+_IS_LINUX = _SYSTEM == "Linux"
+# Only defined by the subprocess module on Windows
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+# Base options for git subprocesses; on Windows, prevent a terminal window from showing
+_SUBPROCESS_KWARGS = {
+    'capture_output': True,
+    'text': True,
+    **({'creationflags': _CREATE_NO_WINDOW} if _IS_WINDOWS else {}),
+}
+# Minimum seconds between pushes of a logs repository by the background commit worker
+_LOG_PUSH_INTERVAL = 30.0
+# Records which workspace storage files each archive holds, so later archives only add changes
+_WORKSPACE_MANIFEST_FILENAME = "manifest.json"
+# Application root (parent of models/), where development-mode logs are kept
+_APP_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Consolidated session log written before route visits became append-only JSONL
+_LEGACY_SESSION_LOG_FILENAME = "session_log.json"
+# Stage transitions, one JSON object per line so each transition is appended
+_STAGE_TRANSITIONS_FILENAME = "stage_transitions.ndjson"
+# Stage transitions file written before transitions became append-only NDJSON
+_LEGACY_STAGE_TRANSITIONS_FILENAME = "stage_transitions.json"
+
+def _iter_archive_files(root: str) -> Iterator[Tuple[str, str, os.DirEntry]]:
+    """
+    Iterate over the files below a directory for archiving, using os.scandir so the
+    file type (and on Windows the stat result) comes from the directory listing.
+    
+    Args:
+        root: Directory to archive
+        
+    Yields:
+        Tuples of (file path, archive name relative to root, directory entry)
+    """
+    stack = [(root, '')]
+    while stack:
+        dirpath, reldir = stack.pop()
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    arcname = os.path.join(reldir, entry.name) if reldir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, arcname))
+                    elif entry.is_file():
+                        yield entry.path, arcname, entry
+        except OSError as e:
+            logger.info(f"Skipping directory that can't be listed: {dirpath} - {e}")
+
+
+class _ZeroPaddedReader:
+    """
+    File wrapper whose reads return zeros past the end of the file, so tarfile can copy
+    the size recorded in the header even if the file was truncated after it was written.
+    """
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        if size is not None and 0 <= len(data) < size:
+            data += bytes(size - len(data))
+        return data
+
+
 class StudyLogger:
     """
     Handles logging of study flow, route visits, and participant actions.
@@ -52,6 +131,22 @@ class StudyLogger:
         self.session_id = self._generate_session_id()
         self.focus_tracker = None
         self.clipboard_tracker = None
+        # (participant_id, route, stage) already logged in this session, so visits are
+        # deduplicated without reading the log file
+        self._logged_routes = set()
+        # Guards _logged_routes and the session log appends, so route visits don't wait on the git lock
+        self._route_log_lock = threading.Lock()
+        # (participant_id, development_mode) whose logs repository was set up and synced in this session
+        self._logging_repos_ready = set()
+        # (participant_id, development_mode) -> resolved logs directory
+        self._logs_dir_cache = {}
+        # stage_transitions.ndjson path -> (mtime_ns, size, transitions), so unchanged files aren't re-parsed
+        self._transitions_cache = {}
+        # Route visits waiting to be committed (and pushed) by the background commit worker
+        self._commit_queue = queue.Queue()
+        self._commit_worker = None
+        self._commit_worker_lock = threading.Lock()
+        self._commit_drain_registered = False
 
     def start_focus_tracking(self, participant_id: str, study_stage: int, development_mode: bool):
         """
@@ -87,6 +182,163 @@ class StudyLogger:
             self.clipboard_tracker.stop()
             self.clipboard_tracker = None
     
+    def flush_tracking_logs(self):
+        """
+        Write any buffered focus and clipboard events to disk so they are included in the next commit.
+        """
+        # Read each tracker once: the commit worker calls this while request threads may stop tracking
+        focus_tracker = self.focus_tracker
+        if focus_tracker:
+            focus_tracker.flush()
+        clipboard_tracker = self.clipboard_tracker
+        if clipboard_tracker:
+            clipboard_tracker.flush()
+    
+    def _enqueue_route_visit_commit(self, participant_id: str, development_mode: bool, commit_message: Optional[str],
+                                    github_token: Optional[str], github_org: Optional[str]):
+        """
+        Queue a logged route visit for the background commit worker, starting the worker if needed.
+        
+        Args:
+            participant_id: The participant's unique identifier
+            development_mode: Whether running in development mode
+            commit_message: Commit message describing the visit, or None to only request an immediate push
+            github_token: Optional GitHub token for pushing logs
+            github_org: Optional GitHub organization
+        """
+        with self._commit_worker_lock:
+            if self._commit_worker is None or not self._commit_worker.is_alive():
+                self._commit_worker = threading.Thread(target=self._run_commit_worker, name="logs-commit", daemon=True)
+                self._commit_worker.start()
+                if not self._commit_drain_registered:
+                    # Registered when the worker first starts (after logging is set up), so queued
+                    # commits and pushes are drained on any interpreter exit, not only under __main__
+                    atexit.register(self._drain_log_commits_at_exit)
+                    self._commit_drain_registered = True
+        self._commit_queue.put((participant_id, development_mode, github_token, github_org, commit_message))
+    
+    def _run_commit_worker(self):
+        """
+        Commit queued route visits, coalescing everything queued so far into one commit per participant.
+        Pushes are coalesced too: each repository is pushed at most once per _LOG_PUSH_INTERVAL seconds,
+        or right away when wait_for_log_commits() queues a flush marker (None). A flush marker also
+        commits tracker output written since the last visit (e.g. after the trackers were stopped).
+        """
+        # Push target -> monotonic time at which its pending push may run
+        pending_pushes = {}
+        last_push_time = {}
+        # Push targets that have had route visits, so a flush knows which logs directories to commit
+        commit_targets = set()
+        while True:
+            timeout = None
+            if pending_pushes:
+                timeout = max(0.0, min(pending_pushes.values()) - time.monotonic())
+            try:
+                batch = [self._commit_queue.get(timeout=timeout)]
+            except queue.Empty:
+                batch = []
+            while True:
+                try:
+                    batch.append(self._commit_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            # Group by repository and push target, keeping the visit order
+            flush_requested = False
+            commit_messages = {}
+            for item in batch:
+                if item is None:
+                    flush_requested = True
+                    continue
+                participant_id, development_mode, github_token, github_org, commit_message = item
+                push_target = (participant_id, development_mode, github_token, github_org)
+                if commit_message is None:
+                    # Push requested for changes committed elsewhere (e.g. a stage transition)
+                    pending_pushes[push_target] = float('-inf')
+                else:
+                    commit_messages.setdefault(push_target, []).append(commit_message)
+                    commit_targets.add(push_target)
+            if flush_requested:
+                for push_target in commit_targets:
+                    commit_messages.setdefault(push_target, [])
+            
+            for push_target, messages in commit_messages.items():
+                participant_id, development_mode, github_token, github_org = push_target
+                try:
+                    committed = self._commit_route_visits(participant_id, development_mode, messages)
+                except Exception as e:
+                    logger.error(f"Error committing route visits: {str(e)}")
+                    continue
+                # Push to remote if token is available
+                if committed and github_token and github_org and push_target not in pending_pushes:
+                    pending_pushes[push_target] = last_push_time.get(push_target, float('-inf')) + _LOG_PUSH_INTERVAL
+            
+            now = time.monotonic()
+            for push_target, due in list(pending_pushes.items()):
+                if flush_requested or due <= now:
+                    del pending_pushes[push_target]
+                    try:
+                        self.push_logs_to_remote(*push_target)
+                    except Exception as e:
+                        logger.error(f"Error pushing logs: {str(e)}")
+                    last_push_time[push_target] = time.monotonic()
+            
+            for _ in batch:
+                self._commit_queue.task_done()
+    
+    def _commit_route_visits(self, participant_id: str, development_mode: bool, messages: List[str]) -> bool:
+        """
+        Commit all pending changes in the logs directory (route visits plus focus and clipboard logs).
+        
+        Args:
+            participant_id: The participant's unique identifier
+            development_mode: Whether running in development mode
+            messages: Commit messages of the visits included in this commit (empty to commit only tracker output)
+        
+        Returns:
+            True if the commit succeeded, False otherwise
+        """
+        logs_path = self.get_logs_directory_path(participant_id, development_mode)
+        if not messages:
+            commit_args = ['commit', '-m', "Log focus and clipboard events"]
+        elif len(messages) == 1:
+            commit_args = ['commit', '-m', messages[0]]
+        else:
+            commit_args = ['commit', '-m', f"Log {len(messages)} route visits", '-m', "\n".join(messages)]
+        
+        with get_participant_git_lock(participant_id):
+            self.flush_tracking_logs()
+            self._run_git_command(logs_path, ['add', '.'], timeout=10)
+            if not messages and self._run_git_command(logs_path, ['diff', '--cached', '--quiet'], timeout=10).returncode == 0:
+                # Flush without new tracker output
+                return False
+            result = self._run_git_command(logs_path, commit_args, timeout=10)
+        
+        if result.returncode != 0:
+            logger.error(f"Failed to commit {len(messages)} route visit(s) for participant {participant_id}. "
+                         f"Error: {result.stderr}")
+            return False
+        
+        logger.info(f"Committed {len(messages)} route visit(s) for participant {participant_id}")
+        return True
+    
+    def wait_for_log_commits(self):
+        """
+        Block until all queued route visits have been committed and pushed,
+        including pushes that were waiting for their interval.
+        """
+        if self._commit_worker is not None and self._commit_worker.is_alive():
+            self._commit_queue.put(None)
+            self._commit_queue.join()
+    
+    def _drain_log_commits_at_exit(self):
+        """
+        Stop the trackers, so their final events are on disk, then commit and push everything still queued.
+        """
+        self.stop_focus_tracking()
+        self.stop_clipboard_tracking()
+        self.wait_for_log_commits()
+    
     def _run_git_command(self, repo_path: str, git_args: List[str], timeout: int = 10) -> subprocess.CompletedProcess:
         """
         Run git command in specific directory using -C flag without changing cwd.
@@ -99,9 +351,34 @@ class StudyLogger:
         Returns:
             subprocess.CompletedProcess result
         """
-        kwargs = self._get_subprocess_kwargs()
-        kwargs['timeout'] = timeout
-        return subprocess.run(['git', '-C', repo_path] + git_args, **kwargs)
+        return subprocess.run(['git', '-C', repo_path] + git_args, **_SUBPROCESS_KWARGS, timeout=timeout)
+    
+    def _commit_files(self, repo_path: str, paths: List[str], commit_message: str,
+                      timeout: int = 10, new_files: bool = False) -> subprocess.CompletedProcess:
+        """
+        Commit the given files in one git invocation when they are already tracked
+        (`git commit -- <paths>` stages them itself), adding them first otherwise.
+        
+        Args:
+            repo_path: Path to the repository
+            paths: Files to commit, relative to the repository
+            commit_message: Commit message
+            timeout: Command timeout in seconds
+            new_files: Whether the caller just created the files, so they are known to need adding
+            
+        Returns:
+            subprocess.CompletedProcess result of the commit
+        """
+        if new_files:
+            self._run_git_command(repo_path, ['add', '--'] + paths, timeout=timeout)
+        result = self._run_git_command(repo_path, ['commit', '-m', commit_message, '--'] + paths, timeout=timeout)
+        if (result.returncode != 0 and not new_files
+                and self._run_git_command(repo_path, ['ls-files', '--error-unmatch', '--'] + paths,
+                                          timeout=timeout).returncode != 0):
+            # New files are unknown to git until added (checked by exit status, git's messages are localized)
+            self._run_git_command(repo_path, ['add', '--'] + paths, timeout=timeout)
+            result = self._run_git_command(repo_path, ['commit', '-m', commit_message, '--'] + paths, timeout=timeout)
+        return result
     
     def _generate_session_id(self) -> str:
         """
@@ -110,9 +387,11 @@ class StudyLogger:
         Returns:
             Unique session identifier string
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # Single clock read; keep the readable local-time prefix used in existing logs
+        seconds = time.time_ns() // 1_000_000_000
+        timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(seconds))
         # Add some randomness to handle multiple starts within the same second
-        random_suffix = f"{random.randint(1000, 9999)}"
+        random_suffix = secrets.token_hex(2)
         return f"{timestamp}_{random_suffix}"
     
     def get_logging_branch_name(self) -> str:
@@ -124,14 +403,79 @@ class StudyLogger:
         """
         return "logging"
     
+    def _get_current_branch(self, repo_path: str) -> Optional[str]:
+        """
+        Read the checked-out branch directly from .git/HEAD, without spawning git.
+        
+        Args:
+            repo_path: Path to the repository
+            
+        Returns:
+            Branch name, or None if HEAD is detached or can't be read
+        """
+        try:
+            with open(os.path.join(repo_path, '.git', 'HEAD'), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+        except OSError:
+            return None
+        if head.startswith('ref: refs/heads/'):
+            return head[len('ref: refs/heads/'):]
+        return None
+    
+    def _checkout_logging_branch(self, logs_path: str, timeout: int = 5) -> bool:
+        """
+        Switch the logs repository to the logging branch, skipping git if it is already checked out.
+        
+        Args:
+            logs_path: Path to the logs repository
+            timeout: Command timeout in seconds
+            
+        Returns:
+            True if the logging branch is checked out, False otherwise
+        """
+        branch_name = self.get_logging_branch_name()
+        if self._get_current_branch(logs_path) == branch_name:
+            return True
+        result = self._run_git_command(logs_path, ['checkout', branch_name], timeout=timeout)
+        if result.returncode != 0:
+            logger.warning(f"Failed to checkout logging branch: {result.stderr}")
+            return False
+        return True
+    
     def get_session_log_filename(self) -> str:
         """
         Get the session log filename (consistent across all sessions).
+        The log is JSONL with one route visit per line, so visits are appended.
         
         Returns:
             Standard session log filename
         """
-        return "session_log.json"
+        return "session_log.jsonl"
+    
+    def _read_session_visits(self, logs_path: str) -> List[Dict]:
+        """
+        Read all logged route visits, including those from a legacy session_log.json.
+        
+        Args:
+            logs_path: Path to the logs directory
+            
+        Returns:
+            List of route visit entries in file order
+        """
+        visits = []
+        legacy_path = os.path.join(logs_path, _LEGACY_SESSION_LOG_FILENAME)
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    for session in json.load(f).get('sessions', []):
+                        visits.extend(session.get('visits', []))
+            except (json.JSONDecodeError, OSError) as e:
+                logger.info(f"Could not read legacy session log file: {e}")
+        
+        log_file_path = os.path.join(logs_path, self.get_session_log_filename())
+        if os.path.exists(log_file_path):
+            visits.extend(iter_jsonl_events(log_file_path))
+        return visits
     
     def start_session_recording(self, participant_id: str, study_stage: int, development_mode: bool) -> bool:
         """
@@ -190,26 +534,30 @@ class StudyLogger:
         """
         return self.screen_recorder.upload_recording_to_azure(participant_id, study_stage)
     
-    def _get_recording_subprocess_kwargs(self) -> Dict[str, Any]:
+    def upload_session_recording_to_azure_async(self, participant_id: str, study_stage: int):
         """
-        Get subprocess keyword arguments for recording processes.
+        Upload the current session recording to Azure Blob Storage in the background.
         
+        Args:
+            participant_id: The participant's unique identifier
+            study_stage: The current study stage
+            
         Returns:
-            Dictionary of keyword arguments for subprocess.Popen()
+            Future resolving to True if upload was successful, False otherwise
         """
-        kwargs = {
-            'stdout': subprocess.PIPE,
-            'stderr': subprocess.PIPE
-        }
-        
-        # Platform-specific settings
-        if platform.system() == "Windows":
-            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            kwargs['shell'] = True
-        else:
-            kwargs['preexec_fn'] = os.setsid
+        return self.screen_recorder.upload_recording_to_azure_async(participant_id, study_stage)
+    
+    def wait_for_recording_uploads(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background recording uploads to finish.
         
-        return kwargs
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+            
+        Returns:
+            True if all uploads finished, False if the timeout expired first
+        """
+        return self.screen_recorder.wait_for_pending_uploads(timeout)
     
     def _get_subprocess_kwargs(self) -> Dict[str, Any]:
         """
@@ -219,17 +567,8 @@ class StudyLogger:
         Returns:
             Dictionary of keyword arguments for subprocess.run()
         """
-        kwargs = {
-            'capture_output': True,
-            'text': True
-        }
-        
-        # On Windows, prevent terminal window from showing
-        if platform.system() == "Windows":
-            kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            kwargs['shell'] = True  # Use shell=True to handle Windows paths correctly
-        
-        return kwargs
+        # Copy, since callers add per-call options such as timeout
+        return dict(_SUBPROCESS_KWARGS)
     
     def get_logs_directory_path(self, participant_id: str, development_mode: bool) -> str:
         """
@@ -242,9 +581,13 @@ class StudyLogger:
         Returns:
             The absolute path to the logs directory
         """
+        cache_key = (participant_id, development_mode)
+        logs_path = self._logs_dir_cache.get(cache_key)
+        if logs_path is not None:
+            return logs_path
+        
         if development_mode:
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            workspace_path = current_dir
+            workspace_path = _APP_ROOT_DIR
             logs_dir_name = f"logs-{participant_id}"
             logs_path = os.path.join(workspace_path, logs_dir_name)
         else:
@@ -253,7 +596,9 @@ class StudyLogger:
             logs_dir_name = f"logs-{participant_id}"
             logs_path = os.path.join(workspace_path, logs_dir_name)
         
-        return os.path.normpath(logs_path)
+        logs_path = os.path.normpath(logs_path)
+        self._logs_dir_cache[cache_key] = logs_path
+        return logs_path
     
     def ensure_logging_repository(self, participant_id: str, development_mode: bool,
                                 github_token: Optional[str], github_org: str) -> bool:
@@ -272,27 +617,33 @@ class StudyLogger:
             True if successful, False otherwise
         """
         logs_path = self.get_logs_directory_path(participant_id, development_mode)
-        original_cwd = os.getcwd()
         
         try:
             # Create logs directory if it doesn't exist
-            if not os.path.exists(logs_path):
-                os.makedirs(logs_path)
-                logger.info(f"Created logs directory: {logs_path}")
+            os.makedirs(logs_path, exist_ok=True)
             
-            # Check if it's already a git repository
+            # Check if it's already a git repository (a single open of .git/HEAD)
             git_dir = os.path.join(logs_path, '.git')
-            if not os.path.exists(git_dir):
-                # Initialize as git repository
-                result = self._run_git_command(logs_path, ['init'], timeout=10)
+            try:
+                with open(os.path.join(git_dir, 'HEAD'), 'rb'):
+                    is_repository = True
+            except FileNotFoundError:
+                is_repository = False
+            
+            if not is_repository:
+                # Initialize as git repository, starting directly on the logging branch
+                # (init.defaultBranch is ignored by old git versions, which start on master as before)
+                branch_name = self.get_logging_branch_name()
+                result = self._run_git_command(logs_path, ['-c', f'init.defaultBranch={branch_name}', 'init'], timeout=10)
                 
                 if result.returncode != 0:
                     logger.warning(f"Failed to initialize git repository in logs directory. Error: {result.stderr}")
                     return False
                 
-                # Set up git config (basic config for logging)
-                self._run_git_command(logs_path, ['config', 'user.name', f'{participant_id}'], timeout=5)
-                self._run_git_command(logs_path, ['config', 'user.email', f'{participant_id}@study.local'], timeout=5)
+                # Set up git config (basic config for logging); appended directly instead of
+                # running 'git config' once per key
+                with open(os.path.join(git_dir, 'config'), 'a', encoding='utf-8') as f:
+                    f.write(f"[user]\n\tname = {participant_id}\n\temail = {participant_id}@study.local\n")
                 
                 # Create initial README
                 readme_content = f"# Study Logs for Participant {participant_id}\n\nThis repository contains anonymized logs for study analysis.\n"
@@ -316,11 +667,6 @@ class StudyLogger:
         except Exception as e:
             logger.info(f"Error ensuring logging repository: {str(e)}")
             return False
-        finally:
-            try:
-                os.chdir(original_cwd)
-            except Exception as e:
-                logger.warning(f"Failed to restore original working directory: {str(e)}")
     
     def _setup_logging_remote(self, participant_id: str, github_token: str, github_org: str) -> bool:
         """
@@ -458,6 +804,7 @@ class StudyLogger:
         """
         Log a route visit with timestamp and relevant context.
         Uses session-specific log file to avoid conflicts with previous runs.
+        The visit is written immediately; committing and pushing it happens on a background worker.
         
         Args:
             participant_id: The participant's ID
@@ -469,113 +816,89 @@ class StudyLogger:
             github_org: Optional GitHub organization
         
         Returns:
-            True if logging was successful, False otherwise
+            True if the visit was written to the log, False otherwise. Commit failures
+            happen later and are logged as errors by the commit worker.
         """
-        lock = get_participant_git_lock(participant_id)
-        with lock:
-            try:
-                # Ensure logging repository exists
-                if not self.ensure_logging_repository(participant_id, development_mode, github_token, github_org):
-                    logger.warning(f"Failed to ensure logging repository for participant {participant_id}")
-                    return False
-                
-                logs_path = self.get_logs_directory_path(participant_id, development_mode)
-                # Use session-specific log file
-                log_file_path = os.path.join(logs_path, self.get_session_log_filename())
-                original_cwd = os.getcwd()
-                
-                # Switch to logs directory
-                os.chdir(logs_path)
-                
-                # Ensure we're on the logging branch
-                self._run_git_command(logs_path, ['checkout', self.get_logging_branch_name()], timeout=5)
-                
-                # Load existing logs from remote or create new structure
-                logs_data = {
-                    'sessions': []
-                }
-                
-                if os.path.exists(log_file_path):
-                    try:
-                        with open(log_file_path, 'r', encoding='utf-8') as f:
-                            logs_data = json.load(f)
-                            # Ensure sessions key exists for compatibility
-                            if 'sessions' not in logs_data:
-                                logs_data['sessions'] = []
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        logger.info("Could not read existing session log file, creating new one")
-                
-                # Find or create session data for this session_id
-                current_session = None
-                for session in logs_data['sessions']:
-                    if session.get('session_id') == self.session_id:
-                        current_session = session
-                        break
-                
-                if current_session is None:
-                    # Create new session entry
-                    current_session = {
-                        'session_id': self.session_id,
-                        'session_start_time': datetime.now().isoformat(),
-                        'visits': []
-                    }
-                    logs_data['sessions'].append(current_session)
-                
-                # Check if this route has already been visited in this session for this stage
-                existing_visits = [visit for visit in current_session['visits'] 
-                                 if visit.get('route') == route_name and visit.get('study_stage') == study_stage]
-                
-                if existing_visits:
-                    logger.info(f"Route {route_name} already logged in this session for stage {study_stage}, skipping")
+        # Check if this route has already been visited in this session for this stage
+        route_key = (participant_id, route_name, study_stage)
+        if route_key in self._logged_routes:
+            logger.info(f"Route {route_name} already logged in this session for stage {study_stage}, skipping")
+            return True
+        
+        try:
+            # Set up and sync the logging repository (git and network) once per participant and session
+            if not self._ensure_logging_repository_once(participant_id, development_mode, github_token, github_org):
+                logger.warning(f"Failed to ensure logging repository for participant {participant_id}")
+                return False
+            
+            logs_path = self.get_logs_directory_path(participant_id, development_mode)
+            # Use session-specific log file
+            log_file_path = os.path.join(logs_path, self.get_session_log_filename())
+            
+            # Create log entry
+            # One clock read for both fields; datetime.timestamp() on a naive value goes through mktime
+            timestamp_unix = time.time()
+            timestamp = datetime.fromtimestamp(timestamp_unix)
+            log_entry = {
+                'participant_id': participant_id,
+                'route': route_name,
+                'study_stage': study_stage,
+                'timestamp': timestamp.isoformat(),
+                'timestamp_unix': timestamp_unix,
+                'development_mode': development_mode,
+                'session_id': self.session_id
+            }
+            
+            # Add session data if provided
+            if session_data:
+                log_entry['session_data'] = session_data
+            
+            with self._route_log_lock:
+                if route_key in self._logged_routes:
                     return True
+                # Append the visit as one compact JSONL line instead of rewriting the whole log
+                with open(log_file_path, 'ab') as f:
+                    f.write(encode_jsonl_line(log_entry))
+                self._logged_routes.add(route_key)
+            
+            # Commit and push all files in the logs directory (including focus and clipboard logs)
+            # on the background worker, so the request doesn't wait for git and the network
+            commit_message = f"Log route visit: {route_name} (stage {study_stage}) at {timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+            self._enqueue_route_visit_commit(participant_id, development_mode, commit_message, github_token, github_org)
+            
+            logger.info(f"Successfully logged route visit: {route_name} for participant {participant_id}, stage {study_stage}")
+            return True
                 
-                # Create log entry
-                timestamp = datetime.now()
-                log_entry = {
-                    'participant_id': participant_id,
-                    'route': route_name,
-                    'study_stage': study_stage,
-                    'timestamp': timestamp.isoformat(),
-                    'timestamp_unix': timestamp.timestamp(),
-                    'development_mode': development_mode,
-                    'session_id': self.session_id
-                }
-                
-                # Add session data if provided
-                if session_data:
-                    log_entry['session_data'] = session_data
-                
-                # Add to current session's visits
-                current_session['visits'].append(log_entry)
-                
-                # Write updated logs
-                with open(log_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(logs_data, f, indent=2, ensure_ascii=False)
-                
-                # Commit and push all files in the logs directory (including focus_log.json)
-                self._run_git_command(logs_path, ['add', '.'], timeout=10)
-
-                commit_message = f"Log route visit: {route_name} (stage {study_stage}) at {timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-                result = self._run_git_command(logs_path, ['commit', '-m', commit_message], timeout=10)
-
-                if result.returncode == 0:
-                    logger.info(f"Successfully logged route visit: {route_name} for participant {participant_id}, stage {study_stage}")
-                    # Push to remote if token is available
-                    if github_token and github_org:
-                        self.push_logs_to_remote(participant_id, development_mode, github_token, github_org)
-                    return True
-                else:
-                    logger.warning(f"Failed to commit log entry. Error: {result.stderr}")
-                    return False
-                    
-            except Exception as e:
-                logger.info(f"Error logging route visit: {str(e)}")
+        except Exception as e:
+            logger.info(f"Error logging route visit: {str(e)}")
+            return False
+    
+    def _ensure_logging_repository_once(self, participant_id: str, development_mode: bool,
+                                        github_token: Optional[str], github_org: Optional[str]) -> bool:
+        """
+        Run ensure_logging_repository and switch to the logging branch the first time a participant's
+        logs are written in this session; later calls return without running git.
+        
+        Args:
+            participant_id: The participant's unique identifier
+            development_mode: Whether running in development mode
+            github_token: Optional GitHub token for the remote
+            github_org: Optional GitHub organization
+        
+        Returns:
+            True if the logging repository is ready, False otherwise
+        """
+        repo_key = (participant_id, development_mode)
+        if repo_key in self._logging_repos_ready:
+            return True
+        with get_participant_git_lock(participant_id):
+            if repo_key in self._logging_repos_ready:
+                return True
+            if not self.ensure_logging_repository(participant_id, development_mode, github_token, github_org):
                 return False
-            finally:
-                try:
-                    os.chdir(original_cwd)
-                except Exception as e:
-                    logger.warning(f"Failed to restore working directory: {str(e)}")
+            self._checkout_logging_branch(self.get_logs_directory_path(participant_id, development_mode))
+            self._logging_repos_ready.add(repo_key)
+        return True
     
     def push_logs_to_remote(self, participant_id: str, development_mode: bool,
                           github_token: str, github_org: str) -> bool:
@@ -594,10 +917,7 @@ class StudyLogger:
         """
         lock = get_participant_git_lock(participant_id)
         with lock:
-            logs_path = self.get_logs_directory_path(participant_id, development_mode)
-            original_cwd = os.getcwd()
             try:
-                os.chdir(logs_path)
                 # Ensure logging repository and branch are properly set up with sync
                 if not self.ensure_logging_repository(participant_id, development_mode, github_token, github_org):
                     logger.warning(f"Failed to ensure logging repository for push")
@@ -607,11 +927,6 @@ class StudyLogger:
             except Exception as e:
                 logger.info(f"Error pushing logs to remote: {str(e)}")
                 return False
-            finally:
-                try:
-                    os.chdir(original_cwd)
-                except Exception as e:
-                    logger.warning(f"Failed to restore original working directory: {str(e)}")
     
     def _push_logs_with_retry(self, participant_id: str, github_token: str, 
                              github_org: str, max_retries: int = 3) -> bool:
@@ -739,64 +1054,49 @@ class StudyLogger:
                     return False
                 
                 logs_path = self.get_logs_directory_path(participant_id, development_mode)
-                log_file_path = os.path.join(logs_path, 'stage_transitions.json')
-                original_cwd = os.getcwd()
-                
-                # Switch to logs directory
-                os.chdir(logs_path)
+                log_file_path = os.path.join(logs_path, _STAGE_TRANSITIONS_FILENAME)
                 
                 # Ensure we're on the logging branch
-                self._run_git_command(logs_path, ['checkout', self.get_logging_branch_name()], timeout=5)
-                
-                # Load existing transitions or create new structure
-                transitions_data = {'transitions': []}
-                if os.path.exists(log_file_path):
-                    try:
-                        with open(log_file_path, 'r', encoding='utf-8') as f:
-                            transitions_data = json.load(f)
-                    except (json.JSONDecodeError, FileNotFoundError):
-                        logger.info("Could not read existing transitions file, creating new one")
+                self._checkout_logging_branch(logs_path)
                 
                 # Check if this transition has already been logged
+                is_new_file = not os.path.exists(log_file_path)
                 transition_key = f"stage_{from_stage}_to_{to_stage}"
-                existing_transitions = [t for t in transitions_data['transitions'] 
+                existing_transitions = [t for t in self._read_stage_transitions(logs_path)
                                       if t.get('from_stage') == from_stage and t.get('to_stage') == to_stage]
                 
                 if existing_transitions:
                     logger.info(f"Transition {transition_key} already logged, skipping")
                     return True
                 
-                # Create transition log entry
-                timestamp = datetime.now()
+                # Create transition log entry (single clock read, see log_route_visit)
+                timestamp_unix = time.time()
+                timestamp = datetime.fromtimestamp(timestamp_unix)
                 transition_entry = {
                     'participant_id': participant_id,
                     'from_stage': from_stage,
                     'to_stage': to_stage,
                     'transition_key': transition_key,
                     'timestamp': timestamp.isoformat(),
-                    'timestamp_unix': timestamp.timestamp(),
+                    'timestamp_unix': timestamp_unix,
                     'development_mode': development_mode
                 }
                 
-                # Add to transitions
-                transitions_data['transitions'].append(transition_entry)
-                
-                # Write updated transitions
-                with open(log_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(transitions_data, f, indent=2, ensure_ascii=False)
+                # Append the transition as one compact NDJSON line instead of rewriting the whole file
+                self._append_stage_transition(log_file_path, transition_entry)
                 
                 # Commit the transition entry
-                self._run_git_command(logs_path, ['add', 'stage_transitions.json'], timeout=5)
-                
                 commit_message = f"Mark stage transition: {transition_key} at {timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
-                result = self._run_git_command(logs_path, ['commit', '-m', commit_message], timeout=10)
+                result = self._commit_files(logs_path, [_STAGE_TRANSITIONS_FILENAME], commit_message, timeout=10,
+                                            new_files=is_new_file)
                 
                 if result.returncode == 0:
                     logger.info(f"Successfully logged stage transition: {transition_key} for participant {participant_id}")
                     
-                    # Push to remote if token is available
+                    # Push to remote if token is available, on the background worker so the
+                    # request doesn't wait for the network
                     if github_token and github_org:
-                        self.push_logs_to_remote(participant_id, development_mode, github_token, github_org)
+                        self._enqueue_route_visit_commit(participant_id, development_mode, None, github_token, github_org)
                     
                     return True
                 else:
@@ -806,11 +1106,57 @@ class StudyLogger:
             except Exception as e:
                 logger.info(f"Error logging stage transition: {str(e)}")
                 return False
-            finally:
-                try:
-                    os.chdir(original_cwd)
-                except Exception as e:
-                    logger.warning(f"Failed to restore working directory: {str(e)}")
+    
+    def _read_stage_transitions(self, logs_path: str) -> List[Dict]:
+        """
+        Read all logged stage transitions, including those from a legacy stage_transitions.json.
+        Transitions from the NDJSON file are reused while its mtime and size are unchanged;
+        the returned list is shared with the cache and must not be modified.
+        
+        Args:
+            logs_path: Path to the logs directory
+            
+        Returns:
+            List of transition entries in file order
+        """
+        log_file_path = os.path.join(logs_path, _STAGE_TRANSITIONS_FILENAME)
+        try:
+            stat = os.stat(log_file_path)
+        except FileNotFoundError:
+            stat = None
+        cached = self._transitions_cache.get(log_file_path)
+        if (stat is not None and cached is not None
+                and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size):
+            return cached[2]
+        
+        transitions = []
+        legacy_path = os.path.join(logs_path, _LEGACY_STAGE_TRANSITIONS_FILENAME)
+        if os.path.exists(legacy_path):
+            try:
+                with open(legacy_path, 'r', encoding='utf-8') as f:
+                    transitions.extend(json.load(f).get('transitions', []))
+            except (json.JSONDecodeError, OSError) as e:
+                logger.info(f"Could not read legacy stage transitions file: {e}")
+        
+        if stat is not None:
+            transitions.extend(iter_jsonl_events(log_file_path))
+            self._transitions_cache[log_file_path] = (stat.st_mtime_ns, stat.st_size, transitions)
+        return transitions
+    
+    def _append_stage_transition(self, log_file_path: str, transition_entry: Dict[str, Any]):
+        """
+        Append a transition to stage_transitions.ndjson and keep the cached transitions current.
+        
+        Args:
+            log_file_path: Path to stage_transitions.ndjson
+            transition_entry: The transition to append
+        """
+        transitions = self._read_stage_transitions(os.path.dirname(log_file_path))
+        with open(log_file_path, 'ab') as f:
+            f.write(encode_jsonl_line(transition_entry))
+        
+        stat = os.stat(log_file_path)
+        self._transitions_cache[log_file_path] = (stat.st_mtime_ns, stat.st_size, transitions + [transition_entry])
     
     def get_stage_transition_history(self, participant_id: str, development_mode: bool) -> List[Dict]:
         """
@@ -825,15 +1171,7 @@ class StudyLogger:
         """
         try:
             logs_path = self.get_logs_directory_path(participant_id, development_mode)
-            log_file_path = os.path.join(logs_path, 'stage_transitions.json')
-            
-            if not os.path.exists(log_file_path):
-                return []
-            
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                transitions_data = json.load(f)
-            
-            return transitions_data.get('transitions', [])
+            return list(self._read_stage_transitions(logs_path))
             
         except Exception as e:
             logger.info(f"Error reading stage transition history: {str(e)}")
@@ -846,20 +1184,18 @@ class StudyLogger:
         Returns:
             The absolute path to VS Code workspace storage directory, or None if not found
         """
-        system = platform.system()
-        
-        if system == "Windows":
+        if _IS_WINDOWS:
             # Windows: %APPDATA%\Code\User\workspaceStorage
             appdata = os.environ.get('APPDATA')
             if appdata:
                 return os.path.join(appdata, 'Code', 'User', 'workspaceStorage')
         
-        elif system == "Darwin":  # macOS
+        elif _IS_DARWIN:  # macOS
             # macOS: ~/Library/Application Support/Code/User/workspaceStorage
             home = os.path.expanduser("~")
             return os.path.join(home, 'Library', 'Application Support', 'Code', 'User', 'workspaceStorage')
         
-        elif system == "Linux":
+        elif _IS_LINUX:
             # Linux: ~/.config/Code/User/workspaceStorage
             home = os.path.expanduser("~")
             return os.path.join(home, '.config', 'Code', 'User', 'workspaceStorage')
@@ -871,7 +1207,9 @@ class StudyLogger:
                                     github_org: Optional[str] = None) -> bool:
         """
         Save VS Code workspace storage for a participant at the end of a coding stage.
-        Creates a compressed archive of the workspace storage and commits it to the logging repository.
+        Creates a compressed archive of the workspace storage files that changed since the previous
+        archive and commits it to the logging repository, together with vscode-storage/manifest.json,
+        which maps every current file to the archive holding it.
         
         Args:
             participant_id: The participant's unique identifier
@@ -896,13 +1234,9 @@ class StudyLogger:
                 return False
             
             logs_path = self.get_logs_directory_path(participant_id, development_mode)
-            original_cwd = os.getcwd()
-            
-            # Switch to logs directory
-            os.chdir(logs_path)
             
             # Ensure we're on the logging branch
-            self._run_git_command(logs_path, ['checkout', self.get_logging_branch_name()], timeout=5)
+            self._checkout_logging_branch(logs_path)
             
             # Create vscode-storage directory if it doesn't exist
             vscode_logs_dir = os.path.join(logs_path, 'vscode-storage')
@@ -915,7 +1249,6 @@ class StudyLogger:
             proxy_copied = False
             if os.path.exists(proxy_file_path):
                 try:
-                    import shutil
                     shutil.copy2(proxy_file_path, proxy_dest_path)
                     logger.info(f"Successfully copied proxy.txt to {proxy_dest_path}")
                     proxy_copied = True
@@ -932,29 +1265,35 @@ class StudyLogger:
                 else:
                     logger.warning(f"Failed to add proxy file to git: {result.stderr}")
             
-            # Create timestamped archive filename
+            # Only files that changed since the previous archive go into the new one
+            manifest_path = os.path.join(vscode_logs_dir, _WORKSPACE_MANIFEST_FILENAME)
+            previous_manifest = self._load_workspace_manifest(manifest_path)
+            manifest, changed_files = self._diff_workspace_storage(vscode_storage_path, previous_manifest)
+            logger.info(f"{len(changed_files)} changed and {len(manifest)} unchanged workspace storage files")
+            
+            # Create timestamped archive of workspace storage
             timestamp = datetime.now()
-            archive_filename = f"workspace_storage_stage{study_stage}_{timestamp.strftime('%Y%m%d_%H%M%S')}.zip"
-            archive_path = os.path.join(vscode_logs_dir, archive_filename)
+            if changed_files:
+                archive_stem = os.path.join(vscode_logs_dir, f"workspace_storage_stage{study_stage}_{timestamp.strftime('%Y%m%d_%H%M%S')}")
+                archive_path, archived = self._create_workspace_storage_archive(
+                    ((file_path, arcname) for file_path, arcname, _ in changed_files), archive_stem)
+                archive_filename = os.path.basename(archive_path)
+                for file_path, arcname, entry in changed_files:
+                    if arcname in archived:
+                        manifest[arcname] = dict(entry, archive=archive_filename)
             
-            # Create zip archive of workspace storage
-            logger.info(f"Creating VS Code workspace storage archive: {archive_filename}")
-            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for root, dirs, files in os.walk(vscode_storage_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Get relative path from workspace storage directory
-                        arcname = os.path.relpath(file_path, vscode_storage_path)
-                        try:
-                            zipf.write(file_path, arcname)
-                        except (OSError, PermissionError) as e:
-                            # Skip files that can't be read (e.g., locked files)
-                            logger.info(f"Skipping file due to permission error: {file_path} - {e}")
-                            continue
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump({'files': manifest}, f, indent=2, ensure_ascii=False)
             
             # Add files to git
             self._run_git_command(logs_path, ['add', 'vscode-storage/'], timeout=10)
             
+            # Exit status 0 means nothing is staged, i.e. nothing changed since the previous
+            # archive, which is already committed
+            if self._run_git_command(logs_path, ['diff', '--cached', '--quiet'], timeout=10).returncode == 0:
+                logger.info(f"VS Code workspace storage unchanged since the last save, nothing to commit for stage {study_stage}")
+                return True
+            
             # Commit the VS Code workspace storage
             commit_message = f"Save VS Code workspace storage for stage {study_stage} at {timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
             result = self._run_git_command(logs_path, ['commit', '-m', commit_message], timeout=15)
@@ -969,12 +1308,117 @@ class StudyLogger:
         except Exception as e:
             logger.info(f"Error saving VS Code workspace storage: {str(e)}")
             return False
-        finally:
-            try:
-                os.chdir(original_cwd)
-            except Exception as e:
-                logger.info(f"Error returning to original directory: {str(e)}")
 
+    def _load_workspace_manifest(self, manifest_path: str) -> Dict[str, Dict]:
+        """
+        Load the workspace storage manifest written by the previous archive.
+        
+        Args:
+            manifest_path: Path to the manifest file
+            
+        Returns:
+            Mapping of archive name to file entry, or an empty dict if there is no manifest yet
+        """
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.info(f"Could not read workspace storage manifest, archiving all files: {e}")
+            return {}
+    
+    def _diff_workspace_storage(self, source_dir: str,
+                                previous_manifest: Dict[str, Dict]) -> Tuple[Dict[str, Dict], List[Tuple[str, str, Dict]]]:
+        """
+        Compare the workspace storage against the previous manifest. Files with the same size and
+        mtime are unchanged without being read; others are hashed, so rewritten but identical files
+        are not archived again.
+        
+        Args:
+            source_dir: Workspace storage directory
+            previous_manifest: Manifest of the previous archive
+            
+        Returns:
+            Tuple of (manifest entries of unchanged files, list of (file path, archive name, new entry) to archive)
+        """
+        manifest = {}
+        changed_files = []
+        for file_path, arcname, dir_entry in _iter_archive_files(source_dir):
+            previous = previous_manifest.get(arcname)
+            try:
+                stat = dir_entry.stat()
+                if previous and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+                    manifest[arcname] = previous
+                    continue
+                digest = hashlib.blake2b()
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+            except OSError as e:
+                # Skip files that can't be read (e.g., locked files)
+                logger.info(f"Skipping file due to permission error: {file_path} - {e}")
+                continue
+            
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'blake2b': digest.hexdigest()}
+            if previous and previous.get('blake2b') == entry['blake2b']:
+                manifest[arcname] = dict(entry, archive=previous['archive'])
+            else:
+                changed_files.append((file_path, arcname, entry))
+        return manifest, changed_files
+    
+    def _create_workspace_storage_archive(self, files: Iterable[Tuple[str, str]], archive_stem: str) -> Tuple[str, set]:
+        """
+        Archive files as multi-threaded zstd compressed tar (.tar.zst) when zstandard
+        is installed, or as a deflate zip otherwise. Files that can't be read (e.g., locked
+        files) are skipped.
+        
+        Args:
+            files: Tuples of (file path, archive name) to archive
+            archive_stem: Archive path without extension
+            
+        Returns:
+            Tuple of (path of the created archive, set of archive names that were written)
+        """
+        archived = set()
+        if zstandard is None:
+            archive_path = f"{archive_stem}.zip"
+            logger.info(f"Creating VS Code workspace storage archive: {os.path.basename(archive_path)}")
+            with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for file_path, arcname in files:
+                    try:
+                        zipf.write(file_path, arcname)
+                    except (OSError, PermissionError) as e:
+                        # Skip files that can't be read (e.g., locked files)
+                        logger.info(f"Skipping file due to permission error: {file_path} - {e}")
+                        continue
+                    archived.add(arcname)
+            return archive_path, archived
+        
+        archive_path = f"{archive_stem}.tar.zst"
+        logger.info(f"Creating VS Code workspace storage archive: {os.path.basename(archive_path)}")
+        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+        with open(archive_path, 'wb') as f, compressor.stream_writer(f) as stream, \
+                tarfile.open(fileobj=stream, mode='w|', dereference=True) as tar:
+            for file_path, arcname in files:
+                try:
+                    tarinfo = tar.gettarinfo(file_path, arcname)
+                    if not tarinfo.isreg():
+                        continue
+                    src = open(file_path, 'rb')
+                except (OSError, PermissionError) as e:
+                    # Skip files that can't be read (e.g., locked files)
+                    logger.info(f"Skipping file due to permission error: {file_path} - {e}")
+                    continue
+                with src:
+                    # Stream the file instead of reading it into memory. The size comes from the open
+                    # handle and a file that shrinks meanwhile is zero-padded, so a file that changes
+                    # while being archived can't corrupt the tar stream
+                    tarinfo.size = os.fstat(src.fileno()).st_size
+                    tar.addfile(tarinfo, _ZeroPaddedReader(src))
+                archived.add(arcname)
+        return archive_path, archived
+    
     def get_session_log_history(self, participant_id: str, development_mode: bool, study_stage: int) -> List[Dict]:
         """
         Get the session log history for a participant and stage from the current session.
@@ -989,20 +1433,10 @@ class StudyLogger:
         """
         try:
             logs_path = self.get_logs_directory_path(participant_id, development_mode)
-            log_file_path = os.path.join(logs_path, self.get_session_log_filename())
-            
-            if not os.path.exists(log_file_path):
-                return []
-            
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                logs_data = json.load(f)
             
             # Collect visits from all sessions for the specified stage
-            all_stage_visits = []
-            for session in logs_data.get('sessions', []):
-                stage_visits = [visit for visit in session.get('visits', []) 
-                            if visit.get('study_stage') == study_stage]
-                all_stage_visits.extend(stage_visits)
+            all_stage_visits = [visit for visit in self._read_session_visits(logs_path)
+                                if visit.get('study_stage') == study_stage]
 
             # Sort by timestamp (using timestamp_unix for reliable sorting)
             all_stage_visits.sort(key=lambda x: x.get('timestamp_unix', 0))
@@ -1030,30 +1464,23 @@ class StudyLogger:
             if not os.path.exists(logs_path):
                 return []
             
-            original_cwd = os.getcwd()
-            
-            try:
-                os.chdir(logs_path)
-                
-                # Ensure we're on the logging branch
-                result = self._run_git_command(logs_path, ['checkout', self.get_logging_branch_name()], timeout=10)
-                
-                if result.returncode != 0:
-                    logger.warning(f"Failed to checkout logging branch: {result.stderr}")
-                    return []
-                
-                # Read session log from the logging branch
-                log_file_path = os.path.join(logs_path, 'session_log.json')
-                if os.path.exists(log_file_path):
-                    with open(log_file_path, 'r', encoding='utf-8') as f:
-                        logs_data = json.load(f)
-                        # Return all sessions from the consolidated log
-                        return logs_data.get('sessions', [])
-                
+            # Ensure we're on the logging branch
+            if not self._checkout_logging_branch(logs_path, timeout=10):
                 return []
-                
-            finally:
-                os.chdir(original_cwd)
+            
+            # Read session log from the logging branch and group the visits by session
+            sessions = {}
+            for visit in self._read_session_visits(logs_path):
+                session_id = visit.get('session_id')
+                if session_id not in sessions:
+                    sessions[session_id] = {
+                        'session_id': session_id,
+                        'session_start_time': visit.get('timestamp'),
+                        'visits': []
+                    }
+                sessions[session_id]['visits'].append(visit)
+            
+            return sorted(sessions.values(), key=lambda session: session['session_start_time'] or '')
             
         except Exception as e:
             logger.info(f"Error reading all session logs: {str(e)}")
@@ -1079,7 +1506,8 @@ class SessionTracker:
             True if route should be logged, False if already logged in this Flask session
         """
         session_key = f'logged_routes_stage{study_stage}'
-        logged_routes = session.get(session_key, [])
+        # Dict keyed by route (O(1) lookup); sessions created before may still hold a list
+        logged_routes = session.get(session_key, {})
         
         route_key = f"{route_name}_stage{study_stage}"
         return route_key not in logged_routes
@@ -1095,9 +1523,12 @@ class SessionTracker:
             study_stage: Current study stage
         """
         session_key = f'logged_routes_stage{study_stage}'
-        logged_routes = session.get(session_key, [])
+        # Stored as a JSON-serializable dict of route keys, since the session can't hold a set
+        logged_routes = session.get(session_key, {})
+        if isinstance(logged_routes, list):
+            logged_routes = dict.fromkeys(logged_routes, True)
         
         route_key = f"{route_name}_stage{study_stage}"
         if route_key not in logged_routes:
-            logged_routes.append(route_key)
+            logged_routes[route_key] = True
             session[session_key] = logged_routes
@@ -200,13 +200,18 @@ def ensure_logging_repository(participant_id, development_mode, github_token, gi
 def log_route_visit(participant_id, route_name, development_mode, study_stage, 
                    session_data=None, github_token=None, github_org=None):
     """Log a route visit with timestamp and relevant context."""
-    # Use synchronous processing only
+    # The visit is written synchronously; its commit and push run in the background
     return _study_logger.log_route_visit(
         participant_id, route_name, development_mode, study_stage, 
         session_data, github_token, github_org
     )
 
 
+def wait_for_log_commits():
+    """Wait until all logged route visits have been committed and pushed."""
+    return _study_logger.wait_for_log_commits()
+
+
 def push_logs_to_remote(participant_id, development_mode, github_token, github_org):
     """Push logs to remote repository on the logging branch."""
     return _study_logger.push_logs_to_remote(participant_id, development_mode, github_token, github_org)
@@ -266,6 +271,16 @@ def upload_session_recording_to_azure(participant_id, study_stage):
     return _study_logger.upload_session_recording_to_azure(participant_id, study_stage)
 
 
+def upload_session_recording_to_azure_async(participant_id, study_stage):
+    """Upload the current session recording to Azure Blob Storage in the background."""
+    return _study_logger.upload_session_recording_to_azure_async(participant_id, study_stage)
+
+
+def wait_for_recording_uploads(timeout=None):
+    """Wait for background recording uploads to finish."""
+    return _study_logger.wait_for_recording_uploads(timeout)
+
+
 def is_recording_active():
     """Check if a recording is currently active."""
     return _study_logger.is_recording_active()